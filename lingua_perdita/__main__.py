@@ -5,8 +5,8 @@ import sys
 
 def main() -> None:
     if len(sys.argv) > 1 and sys.argv[1] == "simulate":
-        from lingua_perdita.simulate import run_simulation
-        run_simulation()
+        from lingua_perdita.simulate import print_simulation_summary, run_simulation
+        print_simulation_summary(*run_simulation(verbose=False))
     else:
         from lingua_perdita.ui.app import run_app
         run_app()
@@ -4,6 +4,8 @@ Every numeric knob lives here for fast iteration.
 Never hardcode balance numbers elsewhere.
 """
 
+from typing import NamedTuple
+
 # ── Click ────────────────────────────────────────────────────────────
 
 CLICK_BASE_VALUE = 1.0
@@ -27,96 +29,115 @@ WORDS_PER_CATEGORY = {
 
 # ── Tools (repeatable generators) ────────────────────────────────────
 
+
+class Tool(NamedTuple):
+    id: str
+    name: str
+    base_cost: int
+    rate: float
+    scaling: float
+
+
 TOOLS = [
-    {
-        "id": "worn_dictionary",
-        "name": "Worn Dictionary",
-        "base_cost": 120,
-        "rate": 1.0,
-        "scaling": 1.15,
-    },
-    {
-        "id": "reference_grammar",
-        "name": "Reference Grammar",
-        "base_cost": 800,
-        "rate": 5.0,
-        "scaling": 1.18,
-    },
-    {
-        "id": "comparative_lexicon",
-        "name": "Comparative Lexicon",
-        "base_cost": 6000,
-        "rate": 25.0,
-        "scaling": 1.22,
-    },
-    {
-        "id": "analytical_engine",
-        "name": "Analytical Engine",
-        "base_cost": 40000,
-        "rate": 100.0,
-        "scaling": 1.30,
-    },
+    Tool(
+        id="worn_dictionary",
+        name="Worn Dictionary",
+        base_cost=120,
+        rate=1.0,
+        scaling=1.15,
+    ),
+    Tool(
+        id="reference_grammar",
+        name="Reference Grammar",
+        base_cost=800,
+        rate=5.0,
+        scaling=1.18,
+    ),
+    Tool(
+        id="comparative_lexicon",
+        name="Comparative Lexicon",
+        base_cost=6000,
+        rate=25.0,
+        scaling=1.22,
+    ),
+    Tool(
+        id="analytical_engine",
+        name="Analytical Engine",
+        base_cost=40000,
+        rate=100.0,
+        scaling=1.30,
+    ),
 ]
 
 # ── One-time upgrades ────────────────────────────────────────────────
 
+
+class Upgrade(NamedTuple):
+    id: str
+    name: str
+    description: str
+    cost: int
+    effect_type: str  # CLICK_FLAT, CLICK_MULT, PRODUCTION_ADD_PCT, TEXT_EFFICIENCY
+    effect_value: float
+
+
 UPGRADES = [
-    {
-        "id": "upg_click_boost",
-        "name": "Sharper Instinct",
-        "description": "Clicking yields +2 more Insight",
-        "cost": 350,
-        "effect_type": "CLICK_FLAT",
-        "effect_value": 2.0,
-    },
-    {
-        "id": "upg_click_mult",
-        "name": "Eureka Moments",
-        "description": "Clicking yields 2x Insight",
-        "cost": 1500,
-        "effect_type": "CLICK_MULT",
-        "effect_value": 2.0,
-    },
-    {
-        "id": "upg_production_boost",
-        "name": "Research Methodology",
-        "description": "+25% Insight production",
-        "cost": 2500,
-        "effect_type": "PRODUCTION_ADD_PCT",
-        "effect_value": 0.25,
-    },
-    {
-        "id": "upg_linguistic_intuition",
-        "name": "Linguistic Intuition",
-        "description": "+15% Insight production",
-        "cost": 5000,
-        "effect_type": "PRODUCTION_ADD_PCT",
-        "effect_value": 0.15,
-    },
-    {
-        "id": "upg_cross_reference",
-        "name": "Cross-Reference Method",
-        "description": "+10% Insight production",
-        "cost": 8500,
-        "effect_type": "PRODUCTION_ADD_PCT",
-        "effect_value": 0.10,
-    },
-    {
-        "id": "upg_text_efficiency",
-        "name": "Contextual Analysis",
-        "description": "+50% Insight from translated texts",
-        "cost": 10000,
-        "effect_type": "TEXT_EFFICIENCY",
-        "effect_value": 1.5,
-    },
-    {
-        "id": "upg_study_focus",
-        "name": "Deep Study",
-        "description": "Clicking yields 3x Insight",
-        "cost": 8000,
-        "effect_type": "CLICK_MULT",
-        "effect_value": 3.0,
-    },
+    Upgrade(
+        id="upg_click_boost",
+        name="Sharper Instinct",
+        description="Clicking yields +2 more Insight",
+        cost=350,
+        effect_type="CLICK_FLAT",
+        effect_value=2.0,
+    ),
+    Upgrade(
+        id="upg_click_mult",
+        name="Eureka Moments",
+        description="Clicking yields 2x Insight",
+        cost=1500,
+        effect_type="CLICK_MULT",
+        effect_value=2.0,
+    ),
+    Upgrade(
+        id="upg_production_boost",
+        name="Research Methodology",
+        description="+25% Insight production",
+        cost=2500,
+        effect_type="PRODUCTION_ADD_PCT",
+        effect_value=0.25,
+    ),
+    Upgrade(
+        id="upg_linguistic_intuition",
+        name="Linguistic Intuition",
+        description="+15% Insight production",
+        cost=5000,
+        effect_type="PRODUCTION_ADD_PCT",
+        effect_value=0.15,
+    ),
+    Upgrade(
+        id="upg_cross_reference",
+        name="Cross-Reference Method",
+        description="+10% Insight production",
+        cost=8500,
+        effect_type="PRODUCTION_ADD_PCT",
+        effect_value=0.10,
+    ),
+    Upgrade(
+        id="upg_text_efficiency",
+        name="Contextual Analysis",
+        description="+50% Insight from translated texts",
+        cost=10000,
+        effect_type="TEXT_EFFICIENCY",
+        effect_value=1.5,
+    ),
+    Upgrade(
+        id="upg_study_focus",
+        name="Deep Study",
+        description="Clicking yields 3x Insight",
+        cost=8000,
+        effect_type="CLICK_MULT",
+        effect_value=3.0,
+    ),
 ]
 
 # ── Roots ────────────────────────────────────────────────────────────
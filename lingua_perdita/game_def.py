@@ -28,31 +28,139 @@ from lingua_perdita.constants import (
     TOOLS,
     UPGRADES,
     WORD_BASE_INSIGHT_RATE,
+    Upgrade,
 )
-from lingua_perdita.language import LanguageModel
-
-
-def _total_words_translated(state: GameState, language: LanguageModel) -> int:
+from lingua_perdita.language import LanguageModel, Word
+
+
+# Requirement for hidden elements that are granted, never purchased
+_NEVER_REQ = Req.custom(lambda s: False)
+
+# Upgrade effect_type → engine effect. TEXT_EFFICIENCY has no engine
+# equivalent: the text effect lambdas check for the upgrade directly.
+_UPGRADE_EFFECT_TYPES: dict[str, EffectType | None] = {
+    "CLICK_FLAT": EffectType.CLICK_FLAT,
+    "CLICK_MULT": EffectType.CLICK_MULT,
+    "PRODUCTION_ADD_PCT": EffectType.PRODUCTION_ADD_PCT,
+    "TEXT_EFFICIENCY": None,
+}
+
+
+def _upgrade_effects(upg: Upgrade) -> tuple[EffectDef, ...]:
+    """Build the engine effects for a one-time upgrade.
+
+    Effect types with no engine equivalent (or unknown ones) add no effects.
+    """
+    etype = _UPGRADE_EFFECT_TYPES.get(upg.effect_type)
+    if etype is None:
+        return ()
+    return (Effect.static(etype, "insight", upg.effect_value),)
+
+
+# Upgrade effects are constant, so build them once at import
+_UPGRADE_EFFECTS: dict[str, tuple[EffectDef, ...]] = {
+    upg.id: _upgrade_effects(upg) for upg in UPGRADES
+}
+
+
+class TranslationTracker:
+    """Incremental translated-word counts for one LanguageModel.
+
+    Words are one-time purchases that never revert, so each sync only probes
+    the words that were still untranslated on the previous sync. Counts are
+    bound to a single GameState and rebuilt if a different state is seen.
+
+    Invariant: word counts on the bound GameState never decrease. Anything
+    that lowers or overwrites element counts outside the engine (loading a
+    save into a live runtime, a progress reset) must call invalidate().
+    """
+
+    def __init__(self, language: LanguageModel) -> None:
+        self.language = language
+        self.total = 0
+        self.per_root: dict[str, int] = {}
+        self.per_text: dict[str, int] = {}
+        self.text_slots: dict[str, int] = {}  # translated slots, repeats included
+        self.translated: set[str] = set()
+        self._state: GameState | None = None
+        self._pending: list[Word] = []
+
+        # (text_id, slot occurrences) for every text each word appears in
+        self._word_texts: dict[str, list[tuple[str, int]]] = {
+            w.id: [
+                (text.id, text.word_ids.count(w.id))
+                for text in language.texts_containing_word(w.id)
+            ]
+            for w in language.word_list
+        }
+
+    def sync(self, state: GameState) -> None:
+        """Fold in any words translated since the last sync."""
+        if state is not self._state:
+            self._reset(state)
+        if not self._pending:
+            return
+
+        element_count = state.element_count
+        still_pending: list[Word] = []
+        for word in self._pending:
+            if element_count(word.id) >= 1:
+                self.total += 1
+                self.translated.add(word.id)
+                self.per_root[word.root_id] += 1
+                for text_id, slots in self._word_texts[word.id]:
+                    self.per_text[text_id] += 1
+                    self.text_slots[text_id] += slots
+            else:
+                still_pending.append(word)
+        self._pending = still_pending
+
+    def invalidate(self) -> None:
+        """Force a full recount on the next sync."""
+        self._state = None
+
+    def _reset(self, state: GameState) -> None:
+        self._state = state
+        self.total = 0
+        self.per_root = {w.root_id: 0 for w in self.language.word_list}
+        self.per_text = {t.id: 0 for t in self.language.text_list}
+        self.text_slots = {t.id: 0 for t in self.language.text_list}
+        self.translated = set()
+        self._pending = list(self.language.word_list)
+
+
+def _total_words_translated(state: GameState, tracker: TranslationTracker) -> int:
     """Count how many words the player has translated."""
-    return sum(
-        1 for w in language.word_list
-        if state.element_count(w.id) >= 1
-    )
+    tracker.sync(state)
+    return tracker.total
 
 
 def _words_translated_in_root(
-    state: GameState, language: LanguageModel, root_id: str,
+    state: GameState, tracker: TranslationTracker, root_id: str,
 ) -> int:
     """Count translated words belonging to a specific root."""
-    root = language.roots[root_id]
-    return sum(
-        1 for wid in root.word_ids
-        if state.element_count(wid) >= 1
-    )
+    tracker.sync(state)
+    return tracker.per_root[root_id]
+
+
+def _words_translated_in_text(
+    state: GameState, tracker: TranslationTracker, text_id: str,
+) -> int:
+    """Count unique translated words appearing in a specific text."""
+    tracker.sync(state)
+    return tracker.per_text[text_id]
+
 
+def build_definition(
+    language: LanguageModel, tracker: TranslationTracker | None = None,
+) -> GameDefinition:
+    """Build a complete GameDefinition from a LanguageModel.
 
-def build_definition(language: LanguageModel) -> GameDefinition:
-    """Build a complete GameDefinition from a LanguageModel."""
+    Pass a tracker to share its translated-word counts with the caller.
+    """
+
+    if tracker is None:
+        tracker = TranslationTracker(language)
 
     currencies = [
         CurrencyDef(id="insight", display_name="Insight", initial_value=0.0),
@@ -64,17 +172,17 @@ def build_definition(language: LanguageModel) -> GameDefinition:
     # ── Tools (repeatable generators) ────────────────────────────────
     for tool in TOOLS:
         elements.append(ElementDef(
-            id=tool["id"],
-            display_name=tool["name"],
-            description=f"+{tool['rate']} Insight/s each",
-            base_cost={"insight": float(tool["base_cost"])},
-            cost_scaling=CostScaling.exponential(tool["scaling"]),
+            id=tool.id,
+            display_name=tool.name,
+            description=f"+{tool.rate} Insight/s each",
+            base_cost={"insight": float(tool.base_cost)},
+            cost_scaling=CostScaling.exponential(tool.scaling),
             effects=[
                 Effect.per_count(
-                    tool["id"],
+                    tool.id,
                     EffectType.PRODUCTION_FLAT,
                     "insight",
-                    tool["rate"],
+                    tool.rate,
                 ),
             ],
             category="tool",
@@ -83,33 +191,13 @@ def build_definition(language: LanguageModel) -> GameDefinition:
 
     # ── One-time upgrades ────────────────────────────────────────────
     for upg in UPGRADES:
-        etype = upg["effect_type"]
-        effects: list[EffectDef] = []
-
-        if etype == "CLICK_FLAT":
-            effects.append(
-                Effect.static(EffectType.CLICK_FLAT, "insight", upg["effect_value"])
-            )
-        elif etype == "CLICK_MULT":
-            effects.append(
-                Effect.static(EffectType.CLICK_MULT, "insight", upg["effect_value"])
-            )
-        elif etype == "PRODUCTION_ADD_PCT":
-            effects.append(
-                Effect.static(EffectType.PRODUCTION_ADD_PCT, "insight", upg["effect_value"])
-            )
-        elif etype == "TEXT_EFFICIENCY":
-            # Text efficiency is handled via the text elements' DynamicFloat
-            # We store it as a tag marker — the text effect lambdas check this
-            pass
-
         elements.append(ElementDef(
-            id=upg["id"],
-            display_name=upg["name"],
-            description=upg["description"],
-            base_cost={"insight": float(upg["cost"])},
+            id=upg.id,
+            display_name=upg.name,
+            description=upg.description,
+            base_cost={"insight": float(upg.cost)},
             max_count=1,
-            effects=effects,
+            effects=list(_UPGRADE_EFFECTS[upg.id]),
             category="upgrade",
             tags={"upgrade"},
         ))
@@ -141,25 +229,19 @@ def build_definition(language: LanguageModel) -> GameDefinition:
             base_cost={},  # free, granted by milestone
             max_count=1,
             effects=discount_effects,
-            requirements=[Req.custom(lambda s: False)],  # never purchasable directly
+            requirements=[_NEVER_REQ],
             category="root_bonus",
             tags={"root_bonus", "hidden"},
         ))
 
     # ── Texts (one-time, provide passive income) ─────────────────────
     for text in language.text_list:
-        text_word_ids = list(text.word_ids)
-        text_id = text.id
-        lang = language  # capture for closure
 
-        def _make_text_effect(t_word_ids: list[str], lang_ref: LanguageModel) -> EffectDef:
+        def _make_text_effect(t_id: str, tr: TranslationTracker) -> EffectDef:
             """Create a DynamicFloat PRODUCTION_FLAT effect for a text."""
             def _value(state: GameState) -> float:
-                translated = sum(
-                    1 for wid in t_word_ids
-                    if state.element_count(wid) >= 1
-                )
-                base_rate = translated * INSIGHT_PER_TRANSLATED_WORD
+                tr.sync(state)
+                base_rate = tr.text_slots[t_id] * INSIGHT_PER_TRANSLATED_WORD
                 # Check text efficiency upgrade
                 if state.element_count("upg_text_efficiency") >= 1:
                     return base_rate * TEXT_EFFICIENCY_MULT
@@ -175,12 +257,11 @@ def build_definition(language: LanguageModel) -> GameDefinition:
         reqs = []
         if text.unlock_threshold > 0:
             threshold = text.unlock_threshold
-            lang_ref = language
 
-            def _make_unlock_req(thresh: int, lr: LanguageModel):
-                return Req.custom(lambda s, t=thresh, l=lr: _total_words_translated(s, l) >= t)
+            def _make_unlock_req(thresh: int, tr: TranslationTracker):
+                return Req.custom(lambda s, t=thresh, tr=tr: _total_words_translated(s, tr) >= t)
 
-            reqs.append(_make_unlock_req(threshold, lang_ref))
+            reqs.append(_make_unlock_req(threshold, tracker))
 
         elements.append(ElementDef(
             id=text.id,
@@ -188,17 +269,16 @@ def build_definition(language: LanguageModel) -> GameDefinition:
             description=f"Study this text for passive Insight",
             base_cost={} if text.unlock_threshold == 0 else {"insight": 0.0},
             max_count=1,
-            effects=[_make_text_effect(text_word_ids, language)],
+            effects=[_make_text_effect(text.id, tracker)],
             requirements=reqs,
             category="text",
             tags={"text"},
         ))
 
     # ── Word knowledge bonus (hidden, auto-purchased) ───────────────
-    def _word_knowledge_value(state: GameState, lang=language) -> float:
+    def _word_knowledge_value(state: GameState, tr=tracker) -> float:
         """Passive Insight/s based on total translated words."""
-        count = sum(1 for w in lang.word_list if state.element_count(w.id) >= 1)
-        return count * WORD_BASE_INSIGHT_RATE
+        return _total_words_translated(state, tr) * WORD_BASE_INSIGHT_RATE
 
     elements.append(ElementDef(
         id="word_knowledge_bonus",
@@ -211,7 +291,7 @@ def build_definition(language: LanguageModel) -> GameDefinition:
             target="insight",
             value=_word_knowledge_value,
         )],
-        requirements=[Req.custom(lambda s: False)],  # never purchasable directly
+        requirements=[_NEVER_REQ],
         category="bonus",
         tags={"bonus", "hidden"},
     ))
@@ -223,7 +303,7 @@ def build_definition(language: LanguageModel) -> GameDefinition:
         id="first_word",
         description="Translated your first word",
         trigger=Req.custom(
-            lambda s, l=language: _total_words_translated(s, l) >= 1
+            lambda s, tr=tracker: _total_words_translated(s, tr) >= 1
         ),
     ))
 
@@ -233,9 +313,9 @@ def build_definition(language: LanguageModel) -> GameDefinition:
         threshold = root.discovery_threshold
         discount_id = f"discount_{root_id}"
 
-        def _make_root_trigger(rid: str, thresh: int, disc_id: str, lr: LanguageModel):
+        def _make_root_trigger(rid: str, thresh: int, disc_id: str, tr: TranslationTracker):
             return Req.custom(
-                lambda s, r=rid, t=thresh, l=lr: _words_translated_in_root(s, l, r) >= t
+                lambda s, r=rid, t=thresh, tr=tr: _words_translated_in_root(s, tr, r) >= t
             )
 
         def _make_root_callback(disc_id_inner: str):
@@ -248,33 +328,30 @@ def build_definition(language: LanguageModel) -> GameDefinition:
         milestones.append(MilestoneDef(
             id=f"root_{root_id}",
             description=f"Discovered root '{root.display_name}'",
-            trigger=_make_root_trigger(root_id, threshold, discount_id, language),
+            trigger=_make_root_trigger(root_id, threshold, discount_id, tracker),
             on_trigger=_make_root_callback(discount_id),
         ))
 
     # first_text_complete: all words in text 0 translated
     first_text = language.text_list[0]
-    first_text_word_ids = list(set(first_text.word_ids))
+    first_text_unique = len(first_text.unique_word_ids)
 
     milestones.append(MilestoneDef(
         id="first_text_complete",
         description=f"Completed '{first_text.display_name}'",
         trigger=Req.custom(
-            lambda s, wids=first_text_word_ids: all(
-                s.element_count(wid) >= 1 for wid in wids
-            )
+            lambda s, tr=tracker, tid=first_text.id, n=first_text_unique:
+                _words_translated_in_text(s, tr, tid) >= n
         ),
     ))
 
     # all_words: all 30 words translated
-    all_word_ids = [w.id for w in language.word_list]
     milestones.append(MilestoneDef(
         id="all_words",
         description="Translated all words",
         trigger=Req.custom(
-            lambda s, wids=all_word_ids: all(
-                s.element_count(wid) >= 1 for wid in wids
-            )
+            lambda s, tr=tracker, n=len(language.word_list):
+                _total_words_translated(s, tr) >= n
         ),
     ))
 
@@ -6,6 +6,7 @@ and word sequences as cached pygame Surfaces.
 
 from __future__ import annotations
 
+import functools
 from typing import Sequence
 
 import pygame
@@ -14,16 +15,29 @@ import glyphforge
 from glyphforge.alphabet import Alphabet
 from glyphforge.glyph import Glyph
 
-from lingua_perdita.constants import DEFAULT_PRESET, DEFAULT_SEED
+from lingua_perdita.constants import ALPHABET_SIZE, DEFAULT_PRESET, DEFAULT_SEED
 from lingua_perdita.language import Word
 
 
+def _pack_color(color: tuple[int, int, int]) -> int:
+    """Pack an RGB tuple into a single int for cheap cache keys."""
+    return (color[0] << 16) | (color[1] << 8) | color[2]
+
+
+@functools.lru_cache(maxsize=8)
+def _generate_alphabet(seed: int, preset: str) -> Alphabet:
+    """Generate a GlyphForge alphabet (cached; deterministic per seed+preset)."""
+    return glyphforge.generate(seed=seed, preset=preset)
+
+
 class GlyphRenderer:
     """Render GlyphForge glyphs as pygame surfaces with caching."""
 
     def __init__(self, seed: int = DEFAULT_SEED, preset: str = DEFAULT_PRESET):
-        self.alphabet: Alphabet = glyphforge.generate(seed=seed, preset=preset)
-        self._cache: dict[tuple, pygame.Surface] = {}
+        self.alphabet: Alphabet = _generate_alphabet(seed, preset)
+        self._glyph_cache: dict[tuple[int, int, int], pygame.Surface] = {}
+        self._word_cache: dict[tuple[bytes, int, int, int], pygame.Surface] = {}
+        self._polygon_cache: dict[int, list[list[tuple[float, float]]]] = {}
 
     def render_glyph(
         self,
@@ -38,13 +52,13 @@ class GlyphRenderer:
             size: Pixel height of the output surface.
             color: RGB fill color.
         """
-        key = ("glyph", index, size, color)
-        if key in self._cache:
-            return self._cache[key]
+        key = (index, size, _pack_color(color))
+        surface = self._glyph_cache.get(key)
+        if surface is not None:
+            return surface
 
-        glyph = self.alphabet[index]
-        surface = self._rasterize_glyph(glyph, size, color)
-        self._cache[key] = surface
+        surface = self._rasterize_glyph(index, size, color)
+        self._glyph_cache[key] = surface
         return surface
 
     def render_word(
@@ -62,9 +76,11 @@ class GlyphRenderer:
             color: RGB fill color.
             spacing: Pixels between glyphs.
         """
-        key = ("word", word.id, size, color)
-        if key in self._cache:
-            return self._cache[key]
+        # Keyed by glyph sequence so words that look the same share a surface
+        key = (word.glyph_indices, size, _pack_color(color), spacing)
+        surface = self._word_cache.get(key)
+        if surface is not None:
+            return surface
 
         glyph_surfaces = [
             self.render_glyph(idx, size, color)
@@ -73,35 +89,70 @@ class GlyphRenderer:
 
         if not glyph_surfaces:
             surface = pygame.Surface((size, size), pygame.SRCALPHA)
-            self._cache[key] = surface
+            self._word_cache[key] = surface
             return surface
 
         total_width = sum(s.get_width() for s in glyph_surfaces) + spacing * (len(glyph_surfaces) - 1)
         max_height = max(s.get_height() for s in glyph_surfaces)
 
         surface = pygame.Surface((total_width, max_height), pygame.SRCALPHA)
+        blit_seq = []
         x = 0
         for gs in glyph_surfaces:
             y_offset = (max_height - gs.get_height()) // 2
-            surface.blit(gs, (x, y_offset))
+            blit_seq.append((gs, (x, y_offset)))
             x += gs.get_width() + spacing
+        surface.blits(blit_seq, doreturn=False)
+        # Match the display's pixel format so the per-frame blit is fast
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
 
-        self._cache[key] = surface
+        self._word_cache[key] = surface
         return surface
 
+    def prewarm(self, styles: Sequence[tuple[int, tuple[int, int, int]]]) -> None:
+        """Rasterize the whole alphabet for each (size, color) pair up front.
+
+        Avoids a burst of cold-cache rasterization on the first frames.
+        """
+        for size, color in styles:
+            for index in range(ALPHABET_SIZE):
+                self.render_glyph(index, size, color)
+
     def clear_cache(self) -> None:
-        """Clear the surface cache (e.g., on theme change)."""
-        self._cache.clear()
+        """Clear the surface caches (e.g., on theme change)."""
+        self._glyph_cache.clear()
+        self._word_cache.clear()
+
+    def _local_polygons(self, index: int) -> list[list[tuple[float, float]]]:
+        """Return a glyph's drawable polygons in bounds-local coordinates (cached).
+
+        Translation to the bounds origin depends only on the glyph, so it is
+        done once and shared by every (size, color) rasterization.
+        """
+        polygons = self._polygon_cache.get(index)
+        if polygons is not None:
+            return polygons
+
+        glyph: Glyph = self.alphabet[index]
+        outline = glyph.outline
+        x_min, y_min = outline.bounds.x_min, outline.bounds.y_min
+        polygons = [
+            [(pt.x - x_min, pt.y - y_min) for pt in polygon]
+            for polygon in outline.polygons
+            if len(polygon) >= 3
+        ]
+        self._polygon_cache[index] = polygons
+        return polygons
 
     def _rasterize_glyph(
         self,
-        glyph: Glyph,
+        index: int,
         size: int,
         color: tuple[int, int, int],
     ) -> pygame.Surface:
-        """Rasterize a single Glyph's outline polygons to a pygame Surface."""
-        outline = glyph.outline
-        bounds = outline.bounds
+        """Rasterize a single glyph's outline polygons to a pygame Surface."""
+        bounds = self.alphabet[index].outline.bounds
 
         if bounds.area < 1e-12:
             return pygame.Surface((size, size), pygame.SRCALPHA)
@@ -127,18 +178,12 @@ class GlyphRenderer:
         offset_x = (w - glyph_w) / 2
         offset_y = (h - glyph_h) / 2
 
-        for polygon in outline.polygons:
-            if len(polygon) < 3:
-                continue
-
-            # Transform points: normalize to bounds, scale, flip Y for screen coords
-            points = []
-            for pt in polygon:
-                px = (pt.x - bounds.x_min) * scale + offset_x
-                # Flip Y: GlyphForge Y increases upward, pygame Y increases downward
-                py = h - ((pt.y - bounds.y_min) * scale + offset_y)
-                points.append((px, py))
+        # Scale, center and flip Y for screen coords in one affine map
+        # (GlyphForge Y increases upward, pygame Y increases downward)
+        ty = h - offset_y
 
+        for polygon in self._local_polygons(index):
+            points = [(x * scale + offset_x, ty - y * scale) for x, y in polygon]
             pygame.draw.polygon(surface, color, points)
 
         return surface
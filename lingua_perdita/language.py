@@ -6,8 +6,13 @@ All generation is deterministic: same seed → same language.
 
 from __future__ import annotations
 
+import functools
 import random
+import sys
+from collections.abc import Mapping
 from dataclasses import dataclass, field
+from operator import attrgetter
+from types import MappingProxyType
 
 from lingua_perdita.constants import (
     ALPHABET_SIZE,
@@ -59,18 +64,21 @@ _ROOT_NAMES = [
 ]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Word:
     """A single word in the lost language."""
     id: str
     root_id: str
-    glyph_indices: tuple[int, ...]  # indices into the 26-glyph alphabet
+    glyph_indices: bytes  # indices into the 26-glyph alphabet, one per byte
     meaning: str
     category: str
     base_cost: int
 
+    def __hash__(self) -> int:
+        return hash(self.id)
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class Root:
     """A morphological root shared by a family of words."""
     id: str
@@ -78,8 +86,11 @@ class Root:
     word_ids: tuple[str, ...]
     discovery_threshold: int = ROOT_DISCOVERY_THRESHOLD
 
+    def __hash__(self) -> int:
+        return hash(self.id)
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class Text:
     """A text composed of word slots (with possible repetition)."""
     id: str
@@ -87,20 +98,62 @@ class Text:
     word_ids: tuple[str, ...]  # ordered word slots, may repeat
     category: str
     unlock_threshold: int  # total words translated to unlock
+    unique_word_ids: frozenset[str] = field(init=False, repr=False, compare=False)
 
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "unique_word_ids", frozenset(self.word_ids))
 
-@dataclass
+    def __hash__(self) -> int:
+        return hash(self.id)
+
+
+@dataclass(slots=True)
+class _WordBuilder:
+    """Mutable Word draft used until roots are assigned."""
+    id: str
+    glyph_indices: bytes
+    meaning: str
+    category: str
+    base_cost: int
+    root_id: str = ""
+
+    def build(self) -> Word:
+        return Word(
+            id=self.id,
+            root_id=self.root_id,
+            glyph_indices=self.glyph_indices,
+            meaning=self.meaning,
+            category=self.category,
+            base_cost=self.base_cost,
+        )
+
+
+@dataclass(frozen=True)
 class LanguageModel:
-    """Complete generated language: words, roots, texts, alphabet config."""
+    """Complete generated language: words, roots, texts, alphabet config.
+
+    Read-only: lookups are mapping proxies and the ordered sequences are
+    tuples, so one cached model can be shared safely between callers.
+    """
     seed: int
-    words: dict[str, Word] = field(default_factory=dict)
-    roots: dict[str, Root] = field(default_factory=dict)
-    texts: dict[str, Text] = field(default_factory=dict)
+    words: Mapping[str, Word]
+    roots: Mapping[str, Root]
+    texts: Mapping[str, Text]
+
+    # Ordered sequences for stable iteration
+    word_list: tuple[Word, ...]
+    root_list: tuple[Root, ...]
+    text_list: tuple[Text, ...]
 
-    # Ordered lists for stable iteration
-    word_list: list[Word] = field(default_factory=list)
-    root_list: list[Root] = field(default_factory=list)
-    text_list: list[Text] = field(default_factory=list)
+    @functools.cached_property
+    def word_ids(self) -> tuple[str, ...]:
+        """Word ids in word_list (cost) order."""
+        return tuple(w.id for w in self.word_list)
+
+    @functools.cached_property
+    def root_ids(self) -> tuple[str, ...]:
+        """Root ids in root_list order."""
+        return tuple(r.id for r in self.root_list)
 
     def words_for_root(self, root_id: str) -> list[Word]:
         """Return all words belonging to a root."""
@@ -109,30 +162,45 @@ class LanguageModel:
 
     def unique_words_in_text(self, text_id: str) -> list[Word]:
         """Return unique words referenced by a text."""
-        text = self.texts[text_id]
-        seen: set[str] = set()
-        result: list[Word] = []
-        for wid in text.word_ids:
-            if wid not in seen:
-                seen.add(wid)
-                result.append(self.words[wid])
-        return result
+        text_words, _ = self._text_index
+        return list(text_words[text_id])
 
     def texts_containing_word(self, word_id: str) -> list[Text]:
         """Return all texts that contain a given word."""
-        return [t for t in self.text_list if word_id in t.word_ids]
-
-
+        _, word_texts = self._text_index
+        return list(word_texts.get(word_id, ()))
+
+    @functools.cached_property
+    def _text_index(self) -> tuple[dict[str, list[Word]], dict[str, list[Text]]]:
+        """Text → unique words and word → texts lookups, built on first use."""
+        text_words: dict[str, list[Word]] = {}
+        word_texts: dict[str, list[Text]] = {}
+        for text in self.text_list:
+            unique_ids = dict.fromkeys(text.word_ids)
+            text_words[text.id] = [self.words[wid] for wid in unique_ids]
+            for wid in unique_ids:
+                word_texts.setdefault(wid, []).append(text)
+        return text_words, word_texts
+
+
+@functools.lru_cache(maxsize=8)
 def generate_language(seed: int = DEFAULT_SEED) -> LanguageModel:
-    """Generate a complete LanguageModel from a seed. Deterministic."""
+    """Generate a complete LanguageModel from a seed. Deterministic.
+
+    Results are cached per seed and shared between callers; the model
+    is frozen and exposes only read-only views of its data.
+    """
     rng = random.Random(seed)
-    model = LanguageModel(seed=seed)
+    # Bound once; these run inside the per-word and per-slot loops
+    randint = rng.randint
+    choice = rng.choice
+    rand = rng.random
 
     # ── Generate words ───────────────────────────────────────────────
-    all_words: list[Word] = []
+    drafts: list[_WordBuilder] = []
     word_index = 0
     used_meanings: set[str] = set()
-    used_glyphs: set[tuple[int, ...]] = set()
+    used_glyphs: set[bytes] = set()
 
     for category, count in WORDS_PER_CATEGORY.items():
         meanings = list(_MEANINGS[category])
@@ -160,53 +228,42 @@ def generate_language(seed: int = DEFAULT_SEED) -> LanguageModel:
             base_cost = int(cost_lo + t * (cost_hi - cost_lo))
 
             # Generate unique glyph sequence
-            glyph_count = rng.randint(glyph_lo, glyph_hi)
+            glyph_count = randint(glyph_lo, glyph_hi)
             for _attempt in range(100):
-                glyph_indices = tuple(
-                    rng.randint(0, ALPHABET_SIZE - 1)
+                glyph_indices = bytes(
+                    randint(0, ALPHABET_SIZE - 1)
                     for _ in range(glyph_count)
                 )
                 if glyph_indices not in used_glyphs:
                     break
             used_glyphs.add(glyph_indices)
 
-            word = Word(
-                id=f"word_{word_index:02d}",
-                root_id="",  # assigned below
+            drafts.append(_WordBuilder(
+                id=sys.intern(f"word_{word_index:02d}"),
                 glyph_indices=glyph_indices,
                 meaning=meaning,
                 category=category,
                 base_cost=base_cost,
-            )
-            all_words.append(word)
+            ))
             word_index += 1
 
     # Shuffle words before assigning to roots so roots aren't category-aligned
-    rng.shuffle(all_words)
+    rng.shuffle(drafts)
 
     # ── Assign words to roots ────────────────────────────────────────
-    root_count = min(ROOT_COUNT, len(all_words) // WORDS_PER_ROOT)
+    root_count = min(ROOT_COUNT, len(drafts) // WORDS_PER_ROOT)
     root_names = _ROOT_NAMES[:root_count]
 
     roots: list[Root] = []
     for ri in range(root_count):
-        root_id = f"root_{ri:02d}"
+        root_id = sys.intern(f"root_{ri:02d}")
         start = ri * WORDS_PER_ROOT
         end = start + WORDS_PER_ROOT
         root_word_ids: list[str] = []
 
-        for wi in range(start, end):
-            old = all_words[wi]
-            # Replace with root_id assigned
-            all_words[wi] = Word(
-                id=old.id,
-                root_id=root_id,
-                glyph_indices=old.glyph_indices,
-                meaning=old.meaning,
-                category=old.category,
-                base_cost=old.base_cost,
-            )
-            root_word_ids.append(old.id)
+        for draft in drafts[start:end]:
+            draft.root_id = root_id
+            root_word_ids.append(draft.id)
 
         roots.append(Root(
             id=root_id,
@@ -215,56 +272,46 @@ def generate_language(seed: int = DEFAULT_SEED) -> LanguageModel:
         ))
 
     # Sort words by cost for stable ordering
-    all_words.sort(key=lambda w: w.base_cost)
-
-    # Populate model
-    for w in all_words:
-        model.words[w.id] = w
-        model.word_list.append(w)
-
-    for r in roots:
-        model.roots[r.id] = r
-        model.root_list.append(r)
+    drafts.sort(key=attrgetter("base_cost"))
+    all_words = [draft.build() for draft in drafts]
 
     # ── Generate texts ───────────────────────────────────────────────
     text_names = _TEXT_NAMES[:TEXT_COUNT]
     text_categories = ["common", "everyday", "academic", "rare"]
 
+    # Word slots stay mutable until orphans are patched in below
+    text_slots: list[list[str]] = []
+    # category → (words in it, words outside it), both in cost order
+    partitions: dict[str, tuple[list[Word], list[Word]]] = {}
+
     for ti in range(TEXT_COUNT):
-        text_id = f"text_{ti:02d}"
-        slot_count = rng.randint(*TEXT_WORD_SLOTS_RANGE)
+        slot_count = randint(*TEXT_WORD_SLOTS_RANGE)
         category = text_categories[ti % len(text_categories)]
 
         # Pick words for this text: bias toward the category but include others
         # First text uses 60% bias; later texts use 40% for better word coverage
         bias = 0.6 if ti == 0 else 0.4
-        category_words = [w for w in all_words if w.category == category]
-        other_words = [w for w in all_words if w.category != category]
+        if category not in partitions:
+            partitions[category] = (
+                [w for w in all_words if w.category == category],
+                [w for w in all_words if w.category != category],
+            )
+        category_words, other_words = partitions[category]
 
         text_word_ids: list[str] = []
         for si in range(slot_count):
-            if category_words and (rng.random() < bias or not other_words):
-                w = rng.choice(category_words)
+            if category_words and (rand() < bias or not other_words):
+                w = choice(category_words)
             else:
-                w = rng.choice(other_words) if other_words else rng.choice(all_words)
+                w = choice(other_words) if other_words else choice(all_words)
             text_word_ids.append(w.id)
 
-        unlock = TEXT_UNLOCK_THRESHOLDS[ti] if ti < len(TEXT_UNLOCK_THRESHOLDS) else ti * 8
-
-        text = Text(
-            id=text_id,
-            display_name=text_names[ti] if ti < len(text_names) else f"Text {ti + 1}",
-            word_ids=tuple(text_word_ids),
-            category=category,
-            unlock_threshold=unlock,
-        )
-        model.texts[text_id] = text
-        model.text_list.append(text)
+        text_slots.append(text_word_ids)
 
     # ── Ensure all words appear in at least one text ──────────────
     all_word_ids_in_texts: set[str] = set()
-    for text in model.text_list:
-        all_word_ids_in_texts.update(text.word_ids)
+    for word_ids in text_slots:
+        all_word_ids_in_texts.update(word_ids)
 
     orphaned = [w.id for w in all_words if w.id not in all_word_ids_in_texts]
     if orphaned:
@@ -272,11 +319,11 @@ def generate_language(seed: int = DEFAULT_SEED) -> LanguageModel:
         remaining = list(orphaned)
 
         # Pass 1: replace within-text duplicates
-        for ti, text in enumerate(model.text_list):
+        for word_ids in text_slots:
             if not remaining:
                 break
             word_counts: dict[str, list[int]] = {}
-            for idx, wid in enumerate(text.word_ids):
+            for idx, wid in enumerate(word_ids):
                 word_counts.setdefault(wid, []).append(idx)
 
             replaceable = []
@@ -284,25 +331,22 @@ def generate_language(seed: int = DEFAULT_SEED) -> LanguageModel:
                 if len(indices) > 1:
                     replaceable.extend(indices[1:])
 
-            word_ids = list(text.word_ids)
             for slot_idx in replaceable:
                 if not remaining:
                     break
                 word_ids[slot_idx] = remaining.pop()
-            _update_text(model, ti, text, tuple(word_ids))
 
         # Pass 2: replace cross-text duplicates (words in multiple texts)
         if remaining:
             # Count how many texts each word appears in
             word_text_count: dict[str, int] = {}
-            for text in model.text_list:
-                for wid in set(text.word_ids):
+            for word_ids in text_slots:
+                for wid in set(word_ids):
                     word_text_count[wid] = word_text_count.get(wid, 0) + 1
 
-            for ti, text in enumerate(model.text_list):
+            for word_ids in text_slots:
                 if not remaining:
                     break
-                word_ids = list(text.word_ids)
                 for slot_idx, wid in enumerate(word_ids):
                     if not remaining:
                         break
@@ -311,23 +355,24 @@ def generate_language(seed: int = DEFAULT_SEED) -> LanguageModel:
                         word_text_count[wid] -= 1
                         word_text_count[orphan_wid] = word_text_count.get(orphan_wid, 0) + 1
                         word_ids[slot_idx] = orphan_wid
-                _update_text(model, ti, text, tuple(word_ids))
-
-    return model
-
-
-def _update_text(
-    model: LanguageModel, idx: int, old_text: Text, new_word_ids: tuple[str, ...],
-) -> None:
-    """Replace a text in the model with updated word_ids."""
-    if new_word_ids == old_text.word_ids:
-        return
-    new_text = Text(
-        id=old_text.id,
-        display_name=old_text.display_name,
-        word_ids=new_word_ids,
-        category=old_text.category,
-        unlock_threshold=old_text.unlock_threshold,
+
+    texts: list[Text] = []
+    for ti, word_ids in enumerate(text_slots):
+        unlock = TEXT_UNLOCK_THRESHOLDS[ti] if ti < len(TEXT_UNLOCK_THRESHOLDS) else ti * 8
+        texts.append(Text(
+            id=sys.intern(f"text_{ti:02d}"),
+            display_name=text_names[ti] if ti < len(text_names) else f"Text {ti + 1}",
+            word_ids=tuple(word_ids),
+            category=text_categories[ti % len(text_categories)],
+            unlock_threshold=unlock,
+        ))
+
+    return LanguageModel(
+        seed=seed,
+        words=MappingProxyType({w.id: w for w in all_words}),
+        roots=MappingProxyType({r.id: r for r in roots}),
+        texts=MappingProxyType({t.id: t for t in texts}),
+        word_list=tuple(all_words),
+        root_list=tuple(roots),
+        text_list=tuple(texts),
     )
-    model.texts[old_text.id] = new_text
-    model.text_list[idx] = new_text
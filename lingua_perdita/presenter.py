@@ -16,7 +16,7 @@ from idleengine import (
 )
 
 from lingua_perdita.constants import TOOLS, UPGRADES
-from lingua_perdita.game_def import build_definition
+from lingua_perdita.game_def import TranslationTracker, build_definition
 from lingua_perdita.language import LanguageModel, Root, Text, Word, generate_language
 
 if TYPE_CHECKING:
@@ -26,9 +26,9 @@ if TYPE_CHECKING:
 # Pre-built effect descriptions for display
 EFFECT_TEXT: dict[str, str] = {}
 for _tool in TOOLS:
-    EFFECT_TEXT[_tool["id"]] = f"+{_tool['rate']} Insight/s each"
+    EFFECT_TEXT[_tool.id] = f"+{_tool.rate} Insight/s each"
 for _upg in UPGRADES:
-    EFFECT_TEXT[_upg["id"]] = _upg["description"]
+    EFFECT_TEXT[_upg.id] = _upg.description
 
 
 class GamePresenter:
@@ -38,10 +38,23 @@ class GamePresenter:
         if language is None:
             language = generate_language(seed)
         self.language = language
-        self.definition = build_definition(language)
+        self._translations = TranslationTracker(language)
+        self.definition = build_definition(language, self._translations)
         self.runtime = GameRuntime(self.definition)
 
+        self._root_milestone_ids: frozenset[str] = frozenset(
+            f"root_{root.id}" for root in language.root_list
+        )
+        # Texts still waiting on their unlock threshold, in text order
+        self._pending_text_ids: list[str] = [t.id for t in language.text_list]
+
+        # Available purchases, rebuilt when _version moves past _avail_version
+        self._version: int = 0
+        self._avail_version: int = -1
+        self._avail_cache: dict[str, ElementStatus] = {}
+
         self._milestones_seen: set[str] = set()
+        self._milestones_seen_count: int = 0  # len(milestones_reached) at last check
         self._new_milestones: list[str] = []
         self._notifications: list[str] = []
 
@@ -65,21 +78,29 @@ class GamePresenter:
     def tick(self, delta: float) -> None:
         """Advance game time and check for new milestones."""
         self.runtime.tick(delta)
+        self._version += 1
         self._auto_unlock_texts()
         self._check_new_milestones()
 
     def _auto_unlock_texts(self) -> None:
         """Auto-purchase texts whose requirements are met (they cost 0)."""
-        for text in self.language.text_list:
-            if self.state.element_count(text.id) == 0:
-                self.runtime.try_purchase(text.id)
+        if not self._pending_text_ids:
+            return
+        state = self.state
+        pending: list[str] = []
+        for text_id in self._pending_text_ids:
+            if state.element_count(text_id) == 0 and not self.runtime.try_purchase(text_id):
+                pending.append(text_id)
+        self._pending_text_ids = pending
 
     def process_click(self) -> float:
         """Process a player click on the tablet. Returns Insight earned."""
+        self._version += 1
         return self.runtime.process_click("insight")
 
     def try_purchase(self, element_id: str) -> bool:
         """Attempt to purchase an element. Returns success."""
+        self._version += 1
         return self.runtime.try_purchase(element_id)
 
     # ── Word/Root/Text queries ───────────────────────────────────────
@@ -87,22 +108,30 @@ class GamePresenter:
     def is_word_translated(self, word_id: str) -> bool:
         return self.state.element_count(word_id) >= 1
 
+    def translated_word_ids(self) -> set[str]:
+        """Ids of all translated words (live view; do not mutate)."""
+        self._translations.sync(self.state)
+        return self._translations.translated
+
     def total_words_translated(self) -> int:
-        return sum(
-            1 for w in self.language.word_list
-            if self.is_word_translated(w.id)
-        )
+        self._translations.sync(self.state)
+        return self._translations.total
 
     def words_translated_in_root(self, root_id: str) -> int:
-        root = self.language.roots[root_id]
-        return sum(
-            1 for wid in root.word_ids
-            if self.state.element_count(wid) >= 1
-        )
+        self._translations.sync(self.state)
+        return self._translations.per_root[root_id]
 
     def is_root_discovered(self, root_id: str) -> bool:
         return self.state.has_milestone(f"root_{root_id}")
 
+    def is_root_milestone(self, milestone_id: str) -> bool:
+        """Whether a milestone is a root discovery."""
+        return milestone_id in self._root_milestone_ids
+
+    def roots_discovered_count(self) -> int:
+        """How many roots have been discovered."""
+        return len(self._root_milestone_ids & self.state.milestones_reached.keys())
+
     def is_text_unlocked(self, text_id: str) -> bool:
         """Check if a text is unlocked (purchased or available)."""
         return self.state.element_count(text_id) >= 1
@@ -114,14 +143,12 @@ class GamePresenter:
 
     def text_translated_count(self, text_id: str) -> int:
         """How many unique words in this text are translated."""
-        text = self.language.texts[text_id]
-        unique_ids = set(text.word_ids)
-        return sum(1 for wid in unique_ids if self.is_word_translated(wid))
+        self._translations.sync(self.state)
+        return self._translations.per_text[text_id]
 
     def text_total_unique_words(self, text_id: str) -> int:
         """Total unique words in this text."""
-        text = self.language.texts[text_id]
-        return len(set(text.word_ids))
+        return len(self.language.texts[text_id].unique_word_ids)
 
     def word_text_membership(self, word_id: str) -> list[tuple[str, str, bool]]:
         """Return texts containing a word: [(text_id, display_name, is_unlocked)]."""
@@ -135,7 +162,7 @@ class GamePresenter:
 
     def get_tools(self) -> list[tuple[ElementDef, ElementStatus | None]]:
         """Return tool elements with their status."""
-        available = {e.id: e for e in self.runtime.get_available_purchases()}
+        available = self._available()
         result = []
         for edef in self.definition.elements:
             if edef.category == "tool":
@@ -144,7 +171,7 @@ class GamePresenter:
 
     def get_upgrades(self) -> list[tuple[ElementDef, ElementStatus | None]]:
         """Return upgrade elements (showing purchased and available)."""
-        available = {e.id: e for e in self.runtime.get_available_purchases()}
+        available = self._available()
         result = []
         for edef in self.definition.elements:
             if edef.category == "upgrade":
@@ -156,7 +183,7 @@ class GamePresenter:
 
     def get_purchasable_words(self) -> list[tuple[Word, ElementStatus | None]]:
         """Return words available for purchase, sorted by cost."""
-        available = {e.id: e for e in self.runtime.get_available_purchases()}
+        available = self._available()
         result = []
         for word in self.language.word_list:
             if not self.is_word_translated(word.id):
@@ -189,7 +216,11 @@ class GamePresenter:
         return milestones
 
     def _check_new_milestones(self) -> None:
-        for mid in self.state.milestones_reached:
+        reached = self.state.milestones_reached
+        if len(reached) == self._milestones_seen_count:
+            return
+        self._milestones_seen_count = len(reached)
+        for mid in reached:
             if mid not in self._milestones_seen:
                 self._milestones_seen.add(mid)
                 self._new_milestones.append(mid)
@@ -204,12 +235,25 @@ class GamePresenter:
     # ── State restoration ────────────────────────────────────────────
 
     def restore_milestones_seen(self) -> None:
-        """After loading, mark existing milestones as seen."""
+        """After loading, mark existing milestones as seen.
+
+        Loading overwrites element counts outside the engine, so the
+        translation counts are recomputed from scratch as well.
+        """
+        self._version += 1
+        self._translations.invalidate()
         for mid in self.state.milestones_reached:
             self._milestones_seen.add(mid)
+        self._milestones_seen_count = len(self.state.milestones_reached)
 
     # ── Helpers ──────────────────────────────────────────────────────
 
+    def _available(self) -> dict[str, ElementStatus]:
+        """Available purchases by element id, cached until the state changes."""
+        if self._avail_version != self._version:
+            self._avail_cache = {e.id: e for e in self.runtime.get_available_purchases()}
+            self._avail_version = self._version
+        return self._avail_cache
+
     def _get_element_status(self, element_id: str) -> ElementStatus | None:
-        available = {e.id: e for e in self.runtime.get_available_purchases()}
-        return available.get(element_id)
+        return self._available().get(element_id)
@@ -7,6 +7,7 @@ LanguageModel from the seed and restores currency/element/milestone state.
 from __future__ import annotations
 
 import json
+import os
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -15,16 +16,24 @@ if TYPE_CHECKING:
 
 SAVE_DIR = Path.home() / ".lingua_perdita"
 SAVE_FILE = SAVE_DIR / "save.json"
+SAVE_TMP_FILE = SAVE_DIR / "save.json.tmp"
 SAVE_VERSION = 1
 
 
 def save_game(runtime: GameRuntime, seed: int) -> None:
     """Serialize current game state to JSON."""
-    SAVE_DIR.mkdir(parents=True, exist_ok=True)
+    write_save(snapshot_game(runtime, seed))
+
 
+def snapshot_game(runtime: GameRuntime, seed: int) -> dict:
+    """Copy the current game state into a JSON-ready dict.
+
+    The result shares nothing with the live state, so it can be written
+    from another thread while the game keeps running.
+    """
     state = runtime.get_state()
 
-    data = {
+    return {
         "version": SAVE_VERSION,
         "seed": seed,
         "time_elapsed": state.time_elapsed,
@@ -45,8 +54,16 @@ def save_game(runtime: GameRuntime, seed: int) -> None:
         "run_number": state.run_number,
     }
 
-    with open(SAVE_FILE, "w") as f:
-        json.dump(data, f, indent=2)
+
+def write_save(data: dict) -> None:
+    """Write a snapshot from snapshot_game() to the save file."""
+    SAVE_DIR.mkdir(parents=True, exist_ok=True)
+
+    # Write to a sibling file and rename so an interrupted save never
+    # leaves a truncated save.json behind
+    with open(SAVE_TMP_FILE, "w") as f:
+        json.dump(data, f, separators=(",", ":"))
+    os.replace(SAVE_TMP_FILE, SAVE_FILE)
 
 
 def load_game(runtime: GameRuntime) -> int | None:
@@ -76,7 +93,8 @@ def load_game(runtime: GameRuntime) -> int | None:
             state.currencies[cid].current = cdata["current"]
             state.currencies[cid].total_earned = cdata["total_earned"]
 
-    # Restore element counts
+    # Restore element counts. This can lower counts on a live runtime, so
+    # callers must refresh derived state (GamePresenter.restore_milestones_seen).
     for eid, edata in data.get("elements", {}).items():
         if eid in state.elements:
             state.elements[eid].count = edata["count"]
@@ -34,12 +34,17 @@ from lingua_perdita.game_def import build_definition
 from lingua_perdita.language import LanguageModel, generate_language
 
 
+def _total_time_in_range(report: SimulationReport) -> bool:
+    """All words translated within the target window."""
+    return PACING_ALL_WORDS_MIN <= report.total_time <= PACING_ALL_WORDS_MAX
+
+
 def build_pacing_bounds(language: LanguageModel) -> list[PacingBound]:
-    """Build pacing bounds for simulation validation."""
-    all_word_ids = [w.id for w in language.word_list]
-    root_ids = [f"root_{r.id}" for r in language.root_list]
+    """Build pacing bounds for simulation validation.
 
-    bounds = [
+    Built fresh on every call so no bound object is shared between runs.
+    """
+    return [
         # No stalls
         PacingBound.no_stalls(severity="error"),
 
@@ -59,7 +64,7 @@ def build_pacing_bounds(language: LanguageModel) -> list[PacingBound]:
         # All words translated — use total_time since the terminal fires on the
         # same tick as the last word purchase, before the milestone can evaluate
         PacingBound.custom(
-            condition=lambda r: PACING_ALL_WORDS_MIN <= r.total_time <= PACING_ALL_WORDS_MAX,
+            condition=_total_time_in_range,
             description=f"Total time {PACING_ALL_WORDS_MIN:.0f}-{PACING_ALL_WORDS_MAX:.0f}s",
             severity="error",
         ),
@@ -75,8 +80,6 @@ def build_pacing_bounds(language: LanguageModel) -> list[PacingBound]:
         ),
     ]
 
-    return bounds
-
 
 def run_simulation(
     seed: int = 42,
@@ -86,14 +89,12 @@ def run_simulation(
     language = generate_language(seed)
     definition = build_definition(language)
 
-    all_word_ids = [w.id for w in language.word_list]
-
     strategy = GreedyCheapest(
         click_profile=ClickProfile(targets={"insight": SIM_CLICK_RATE}),
     )
 
     terminal = Terminal.any(
-        Terminal.all_purchased(element_ids=all_word_ids),
+        Terminal.all_purchased(element_ids=language.word_ids),
         Terminal.time(SIM_TIME_CAP),
     )
 
@@ -109,22 +110,31 @@ def run_simulation(
     bounds = build_pacing_bounds(language)
 
     if verbose:
-        print(format_text_report(report, bounds))
-        print()
-
-        # Print purchase log (first 30 and last 10)
-        print("PURCHASE LOG (first 30):")
-        for p in report.purchases[:30]:
-            mins = p.time / 60
-            print(f"  {mins:6.1f}m  {p.element_id:<25s}  cost={p.cost_paid}")
-        if len(report.purchases) > 30:
-            print(f"  ... ({len(report.purchases) - 40} more) ...")
-            for p in report.purchases[-10:]:
-                mins = p.time / 60
-                print(f"  {mins:6.1f}m  {p.element_id:<25s}  cost={p.cost_paid}")
+        print_simulation_summary(report, bounds)
 
     return report, bounds
 
 
+def print_simulation_summary(
+    report: SimulationReport,
+    bounds: list[PacingBound],
+) -> None:
+    """Print the pacing report and purchase log for a simulation run."""
+    def purchase_line(p) -> str:
+        return f"  {p.time / 60:6.1f}m  {p.element_id:<25s}  cost={p.cost_paid}"
+
+    lines = [format_text_report(report, bounds), ""]
+
+    # Purchase log (first 30 and last 10)
+    lines.append("PURCHASE LOG (first 30):")
+    lines.extend(purchase_line(p) for p in report.purchases[:30])
+    if len(report.purchases) > 30:
+        lines.append(f"  ... ({len(report.purchases) - 40} more) ...")
+        lines.extend(purchase_line(p) for p in report.purchases[-10:])
+
+    # One write instead of a print() per line
+    print("\n".join(lines))
+
+
 if __name__ == "__main__":
     run_simulation()
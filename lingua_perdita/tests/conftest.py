@@ -0,0 +1,12 @@
+"""Shared test fixtures."""
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def sim_42():
+    """(report, bounds) from one seed-42 simulation, shared across tests."""
+    # Imported here so the engine-free language tests collect on their own
+    from lingua_perdita.simulate import run_simulation
+
+    return run_simulation(seed=42, verbose=False)
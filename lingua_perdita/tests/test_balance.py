@@ -2,25 +2,26 @@
 
 import pytest
 
+from lingua_perdita.language import generate_language
 from lingua_perdita.simulate import build_pacing_bounds, run_simulation
 
 
-def test_simulation_completes():
+def test_simulation_completes(sim_42):
     """Simulation runs to completion without errors."""
-    report, bounds = run_simulation(seed=42, verbose=False)
+    report, bounds = sim_42
     assert report.total_time > 0
     assert len(report.purchases) > 0
 
 
-def test_no_stalls():
+def test_no_stalls(sim_42):
     """Simulation has no stalls."""
-    report, bounds = run_simulation(seed=42, verbose=False)
+    report, bounds = sim_42
     assert len(report.stalls) == 0, f"Stalls detected: {report.stalls}"
 
 
-def test_pacing_bounds_pass():
+def test_pacing_bounds_pass(sim_42):
     """All pacing bounds pass (errors only — warnings OK)."""
-    report, bounds = run_simulation(seed=42, verbose=False)
+    report, bounds = sim_42
 
     failures = []
     for bound in bounds:
@@ -31,24 +32,25 @@ def test_pacing_bounds_pass():
     assert not failures, f"Pacing failures:\n" + "\n".join(failures)
 
 
-def test_all_words_purchased():
+def test_all_words_purchased(sim_42):
     """All 30 words are eventually purchased."""
-    report, _ = run_simulation(seed=42, verbose=False)
-    word_purchases = {p.element_id for p in report.purchases if p.element_id.startswith("word_")}
+    report, _ = sim_42
+    word_ids = set(generate_language(42).word_ids)
+    word_purchases = {p.element_id for p in report.purchases if p.element_id in word_ids}
     assert len(word_purchases) == 30, f"Only {len(word_purchases)} words purchased"
 
 
-def test_first_word_timing():
+def test_first_word_timing(sim_42):
     """First word is translated within pacing bounds."""
-    report, _ = run_simulation(seed=42, verbose=False)
+    report, _ = sim_42
     first_word_time = report.milestone_time("first_word")
     assert first_word_time is not None, "first_word milestone never reached"
     assert first_word_time <= 120.0, f"First word at {first_word_time:.1f}s (max 120s)"
 
 
-def test_deterministic():
+def test_deterministic(sim_42):
     """Same seed produces same simulation results."""
-    report1, _ = run_simulation(seed=42, verbose=False)
+    report1, _ = sim_42
     report2, _ = run_simulation(seed=42, verbose=False)
     assert report1.total_time == report2.total_time
     assert len(report1.purchases) == len(report2.purchases)
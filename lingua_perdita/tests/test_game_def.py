@@ -3,7 +3,7 @@
 from idleengine import GameRuntime
 
 from lingua_perdita.constants import ROOT_COUNT, TEXT_COUNT, TOOLS, UPGRADES
-from lingua_perdita.game_def import build_definition
+from lingua_perdita.game_def import TranslationTracker, build_definition
 from lingua_perdita.language import generate_language
 
 
@@ -210,3 +210,54 @@ def test_word_knowledge_bonus():
     assert rate_one > rate_zero, (
         f"Translating a word should increase rate via knowledge bonus: {rate_zero} -> {rate_one}"
     )
+
+
+def test_translation_tracker_counts():
+    """Tracker picks up purchases incrementally and per root."""
+    runtime, language, _ = _make_runtime()
+    runtime.state.currencies["insight"].current = 1_000_000.0
+    tracker = TranslationTracker(language)
+
+    tracker.sync(runtime.state)
+    assert tracker.total == 0
+
+    root = language.root_list[0]
+    for wid in root.word_ids[:2]:
+        runtime.try_purchase(wid)
+
+    tracker.sync(runtime.state)
+    assert tracker.total == 2
+    assert tracker.translated == set(root.word_ids[:2])
+    assert tracker.per_root[root.id] == 2
+    for text in language.text_list:
+        expected = len(set(text.word_ids) & set(root.word_ids[:2]))
+        assert tracker.per_text[text.id] == expected
+        slots = sum(1 for wid in text.word_ids if wid in root.word_ids[:2])
+        assert tracker.text_slots[text.id] == slots
+
+    # Counts lowered outside the engine are picked up after invalidate()
+    runtime.state.elements[root.word_ids[0]].count = 0
+    tracker.invalidate()
+    tracker.sync(runtime.state)
+    assert tracker.total == 1
+    assert tracker.translated == {root.word_ids[1]}
+
+    # A fresh state rebuilds the counts from scratch
+    other, _, _ = _make_runtime()
+    tracker.sync(other.state)
+    assert tracker.total == 0
+    assert not tracker.translated
+
+
+def test_first_text_complete_milestone():
+    """Translating every word of the first text reaches the milestone."""
+    runtime, language, _ = _make_runtime()
+    runtime.state.currencies["insight"].current = 10_000_000.0
+
+    first_text = language.text_list[0]
+    for wid in set(first_text.word_ids):
+        runtime.try_purchase(wid)
+    runtime.tick(0.1)
+
+    assert runtime.state.has_milestone("first_text_complete")
+    assert not runtime.state.has_milestone("all_words")
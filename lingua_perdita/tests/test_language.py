@@ -1,5 +1,9 @@
 """Tests for language model generation."""
 
+import dataclasses
+
+import pytest
+
 from lingua_perdita.constants import (
     ROOT_COUNT,
     ROOT_DISCOVERY_THRESHOLD,
@@ -13,7 +17,7 @@ from lingua_perdita.language import generate_language
 def test_determinism():
     """Same seed produces identical language models."""
     a = generate_language(seed=42)
-    b = generate_language(seed=42)
+    b = generate_language.__wrapped__(seed=42)  # bypass the per-seed cache
 
     assert len(a.words) == len(b.words)
     for wid in a.words:
@@ -28,6 +32,24 @@ def test_determinism():
         assert a.texts[tid] == b.texts[tid]
 
 
+def test_generation_cached_per_seed():
+    """Repeated calls with a seed share one model."""
+    assert generate_language(seed=7) is generate_language(seed=7)
+    assert generate_language(seed=7) is not generate_language(seed=8)
+
+
+def test_cached_model_is_read_only():
+    """The shared per-seed model cannot be mutated by a caller."""
+    model = generate_language(seed=7)
+    word = model.word_list[0]
+    with pytest.raises(TypeError):
+        model.words[word.id] = word
+    with pytest.raises(AttributeError):
+        model.word_list.append(word)
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        model.words = {}
+
+
 def test_different_seeds():
     """Different seeds produce different languages."""
     a = generate_language(seed=1)
@@ -96,7 +118,7 @@ def test_word_costs_increase():
     """Words are sorted by cost (cheapest first)."""
     model = generate_language()
     costs = [w.base_cost for w in model.word_list]
-    assert costs == sorted(costs)
+    assert all(a <= b for a, b in zip(costs, costs[1:]))
 
 
 def test_glyph_indices_valid():
@@ -128,13 +150,14 @@ def test_unique_words_in_text():
         # Every unique word should appear in the text
         for w in unique:
             assert w.id in text.word_ids
+        assert set(ids) == text.unique_word_ids
 
 
 def test_text_unlock_thresholds():
     """Texts have increasing unlock thresholds."""
     model = generate_language()
     thresholds = [t.unlock_threshold for t in model.text_list]
-    assert thresholds == sorted(thresholds)
+    assert all(a <= b for a, b in zip(thresholds, thresholds[1:]))
     # First text should be free (threshold 0)
     assert thresholds[0] == 0
 
@@ -2,13 +2,18 @@
 
 from __future__ import annotations
 
+import functools
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+
 import pygame
 
 from lingua_perdita.constants import DEFAULT_PRESET, DEFAULT_SEED
 from lingua_perdita.glyphs import GlyphRenderer
 from lingua_perdita.language import generate_language
 from lingua_perdita.presenter import GamePresenter
-from lingua_perdita.save import get_save_seed, has_save, load_game, save_game
+from lingua_perdita.save import get_save_seed, has_save, load_game, snapshot_game, write_save
 from lingua_perdita.ui.renderer import Renderer
 from lingua_perdita.ui.screens import LexiconScreen, Screen, ShopScreen, TabletScreen
 from lingua_perdita.ui.theme import (
@@ -19,10 +24,10 @@ from lingua_perdita.ui.theme import (
     CONTENT_WIDTH,
     DARK_GRAY,
     FPS,
-    FONT_SIZE,
     FONT_SIZE_LARGE,
     FONT_SIZE_SMALL,
     FONT_SIZE_TINY,
+    GLYPH_STYLES,
     GOLD,
     GOLD_BRIGHT,
     GOLD_DIM,
@@ -32,6 +37,8 @@ from lingua_perdita.ui.theme import (
     NOTIF_BG,
     NOTIF_COLORS,
     NOTIF_DURATION,
+    NOTIF_ERROR,
+    NOTIF_FADE_STEPS,
     NOTIF_INFO,
     NOTIF_MILESTONE,
     NOTIF_ROOT,
@@ -46,9 +53,26 @@ from lingua_perdita.ui.theme import (
     format_number,
     format_rate,
     get_font,
+    preload_fonts,
+    render_text,
 )
 
 
+@dataclass(slots=True)
+class Notification:
+    """A toast message counting down to expiry."""
+    msg: str
+    remaining: float  # seconds left on screen
+    ntype: int  # NOTIF_ROOT / NOTIF_MILESTONE / NOTIF_INFO / NOTIF_ERROR
+
+
+@functools.lru_cache(maxsize=128)
+def _fade(color: tuple[int, int, int], step: int) -> tuple[int, int, int]:
+    """Scale a color's brightness by step / NOTIF_FADE_STEPS."""
+    alpha = step / NOTIF_FADE_STEPS
+    return tuple(int(c * alpha) for c in color)
+
+
 class App:
     """Main application managing screens, input, and game loop."""
 
@@ -56,6 +80,7 @@ class App:
         pygame.init()
         self.screen = pygame.display.set_mode((SCREEN_W, SCREEN_H))
         pygame.display.set_caption("Lingua Perdita")
+        preload_fonts()
         self.clock = pygame.time.Clock()
         self.renderer = Renderer(self.screen)
         self.running = True
@@ -70,6 +95,7 @@ class App:
         language = generate_language(seed)
         self.presenter = GamePresenter(language=language, seed=seed)
         self.glyph_renderer = GlyphRenderer(seed=seed, preset=DEFAULT_PRESET)
+        self.glyph_renderer.prewarm(GLYPH_STYLES)
 
         # Load save if exists
         if has_save():
@@ -85,11 +111,33 @@ class App:
         ]
         self.active_screen: int = 0
 
-        # Tab rects (rebuilt each frame)
-        self._tab_rects: list[tuple[pygame.Rect, int]] = []
+        # Tab rects (fixed layout: one equal-width tab per screen)
+        tab_w = SCREEN_W // len(self._screens)
+        self._tab_rects: list[tuple[pygame.Rect, int]] = [
+            (pygame.Rect(i * tab_w, HEADER_HEIGHT, tab_w - 1, TAB_HEIGHT), i)
+            for i in range(len(self._screens))
+        ]
+        self._tab_hit_rects: list[pygame.Rect] = [rect for rect, _ in self._tab_rects]
 
         # Notifications
-        self._notifications: list[tuple[str, float, str]] = []  # (msg, remaining, type)
+        self._notifications: list[Notification] = []
+        # One fixed slot per visible notification (at most three, stacked)
+        notif_w = min(350, SCREEN_W // 3)
+        self._notif_rects: list[pygame.Rect] = [
+            pygame.Rect(
+                SCREEN_W - notif_w - PADDING,
+                HEADER_HEIGHT + TAB_HEIGHT + PADDING + i * 34,
+                notif_w, 28,
+            )
+            for i in range(3)
+        ]
+
+        # Header readouts, re-rendered only when their text changes
+        self._insight_label: tuple[str, pygame.Surface] = ("", pygame.Surface((0, 0)))
+        self._rate_label: tuple[str, pygame.Surface] = ("", pygame.Surface((0, 0)))
+
+        # Cursor currently set (None until the first frame sets one)
+        self._cursor_is_hand: bool | None = None
 
         # Tick accumulator
         self._tick_acc: float = 0.0
@@ -97,6 +145,11 @@ class App:
         # Auto-save timer
         self._autosave_timer: float = 60.0
 
+        # Save files are written on one worker thread, in submission order
+        self._save_executor = ThreadPoolExecutor(max_workers=1)
+        # Save outcomes posted by the worker, turned into notifications in _update
+        self._save_results: deque[Notification] = deque()
+
         # Auto-click (toggle with F1): ~5 clicks/sec
         self._auto_click: bool = False
         self._auto_click_acc: float = 0.0
@@ -111,11 +164,18 @@ class App:
             self._draw()
             pygame.display.flip()
 
-        # Save on exit
-        save_game(self.presenter.runtime, self.presenter.language.seed)
-        pygame.quit()
+        # Save on exit, waiting for any pending writes
+        try:
+            final_save = self._save()
+            self._save_executor.shutdown(wait=True)
+            final_save.result()
+        finally:
+            pygame.quit()
 
     def _handle_events(self) -> None:
+        # peek() still pumps the OS queue, so idle frames stay responsive
+        if not pygame.event.peek():
+            return
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 self.running = False
@@ -145,13 +205,12 @@ class App:
                     self._auto_click = not self._auto_click
                     self._auto_click_acc = 0.0
                     state = "ON" if self._auto_click else "OFF"
-                    self._notifications.append((f"Auto-click {state}", NOTIF_DURATION, NOTIF_INFO))
+                    self._notifications.append(Notification(f"Auto-click {state}", NOTIF_DURATION, NOTIF_INFO))
                     continue
 
                 # Ctrl+S save
                 if event.key == pygame.K_s and (event.mod & pygame.KMOD_CTRL):
-                    save_game(self.presenter.runtime, self.presenter.language.seed)
-                    self._notifications.append(("Game saved!", NOTIF_DURATION, NOTIF_INFO))
+                    self._save(announce=True)
                     continue
 
             # Check main tab bar click
@@ -171,28 +230,34 @@ class App:
             self._screens[self.active_screen].handle_event(event, self.presenter)
 
     def _update(self, dt: float) -> None:
-        # Fixed game ticks
+        # Fixed game ticks, batched into one call when a slow frame
+        # accumulates several
         self._tick_acc += dt
-        while self._tick_acc >= TICK_INTERVAL:
-            self.presenter.tick(TICK_INTERVAL)
-            self._tick_acc -= TICK_INTERVAL
+        ticks, self._tick_acc = divmod(self._tick_acc, TICK_INTERVAL)
+        if ticks:
+            self.presenter.tick(ticks * TICK_INTERVAL)
 
         # Update active screen
         self._screens[self.active_screen].update(dt)
 
+        # Report finished saves (posted from the save worker)
+        while self._save_results:
+            self._notifications.append(self._save_results.popleft())
+
         # Check for new milestones
         new_milestones = self.presenter.pop_new_milestones()
         for mid in new_milestones:
             text = self.presenter.get_milestone_text(mid)
-            ntype = NOTIF_ROOT if mid.startswith("root_") else NOTIF_MILESTONE
-            self._notifications.append((text, NOTIF_DURATION, ntype))
-
-        # Decay notifications
-        self._notifications = [
-            (msg, remaining - dt, ntype)
-            for msg, remaining, ntype in self._notifications
-            if remaining - dt > 0
-        ]
+            ntype = NOTIF_ROOT if self.presenter.is_root_milestone(mid) else NOTIF_MILESTONE
+            self._notifications.append(Notification(text, NOTIF_DURATION, ntype))
+
+        # Decay notifications in place; walk backwards so deletes are safe
+        notifications = self._notifications
+        for i in range(len(notifications) - 1, -1, -1):
+            notif = notifications[i]
+            notif.remaining -= dt
+            if notif.remaining <= 0:
+                del notifications[i]
 
         # Auto-click
         if self._auto_click:
@@ -204,61 +269,59 @@ class App:
         # Auto-save
         self._autosave_timer -= dt
         if self._autosave_timer <= 0:
-            save_game(self.presenter.runtime, self.presenter.language.seed)
+            self._save()
             self._autosave_timer = 60.0
 
     def _draw(self) -> None:
+        mouse_pos = pygame.mouse.get_pos()
         self.renderer.clear()
         self._draw_header()
-        self._draw_tabs()
+        self._draw_tabs(mouse_pos)
         self._screens[self.active_screen].draw(
             self.renderer, self.presenter, self.glyph_renderer
         )
         self._draw_status_bar()
         self._draw_notifications()
-        self._update_cursor()
+        self._update_cursor(mouse_pos)
         self.renderer.apply_scanlines()
 
     def _draw_header(self) -> None:
         # Background
         pygame.draw.rect(self.screen, BG_DARK, (0, 0, SCREEN_W, HEADER_HEIGHT))
 
-        font_large = get_font(FONT_SIZE_LARGE)
-        font = get_font(FONT_SIZE)
-        font_sm = get_font(FONT_SIZE_SMALL)
-
         # Title
-        title = font_large.render("LINGUA PERDITA", True, GOLD)
+        title = render_text("LINGUA PERDITA", GOLD, FONT_SIZE_LARGE)
         self.screen.blit(title, (PADDING, 8))
 
         # Subtitle
-        subtitle = font_sm.render("Excavation I — The Foundation Tablet", True, TEXT_DIM)
+        subtitle = render_text("Excavation I — The Foundation Tablet", TEXT_DIM, FONT_SIZE_SMALL)
         self.screen.blit(subtitle, (PADDING, 36))
 
         # Insight display (right side)
         insight = self.presenter.insight_value()
         rate = self.presenter.insight_rate()
 
-        value_text = font_large.render(f"{format_number(insight)} Insight", True, GOLD_BRIGHT)
+        label = f"{format_number(insight)} Insight"
+        if label != self._insight_label[0]:
+            surface = get_font(FONT_SIZE_LARGE).render(label, True, GOLD_BRIGHT)
+            self._insight_label = (label, surface)
+        value_text = self._insight_label[1]
         self.screen.blit(value_text, (SCREEN_W - value_text.get_width() - PADDING, 8))
 
-        rate_text = font_sm.render(format_rate(rate), True, GOLD_DIM)
+        label = format_rate(rate)
+        if label != self._rate_label[0]:
+            surface = get_font(FONT_SIZE_SMALL).render(label, True, GOLD_DIM)
+            self._rate_label = (label, surface)
+        rate_text = self._rate_label[1]
         self.screen.blit(rate_text, (SCREEN_W - rate_text.get_width() - PADDING, 36))
 
         # Separator
         self.renderer.hline(0, HEADER_HEIGHT - 1, SCREEN_W, BORDER)
 
-    def _draw_tabs(self) -> None:
-        self._tab_rects.clear()
-        mouse_pos = pygame.mouse.get_pos()
-        tab_w = SCREEN_W // len(self._screens)
-        y = HEADER_HEIGHT
-
-        for i, screen in enumerate(self._screens):
+    def _draw_tabs(self, mouse_pos: tuple[int, int]) -> None:
+        for tab_rect, i in self._tab_rects:
+            screen = self._screens[i]
             is_active = i == self.active_screen
-            tab_rect = pygame.Rect(i * tab_w, y, tab_w - 1, TAB_HEIGHT)
-            self._tab_rects.append((tab_rect, i))
-
             is_hovered = tab_rect.collidepoint(mouse_pos) and not is_active
 
             if is_active:
@@ -271,9 +334,8 @@ class App:
             pygame.draw.rect(self.screen, bg, tab_rect)
             pygame.draw.rect(self.screen, color if is_active else BORDER, tab_rect, 1)
 
-            font = get_font(FONT_SIZE_SMALL)
             label = f"{i + 1}:{screen.name}"
-            rendered = font.render(label, True, color)
+            rendered = render_text(label, color, FONT_SIZE_SMALL)
             tx = tab_rect.x + (tab_rect.width - rendered.get_width()) // 2
             ty = tab_rect.y + (tab_rect.height - rendered.get_height()) // 2
             self.screen.blit(rendered, (tx, ty))
@@ -283,59 +345,44 @@ class App:
         pygame.draw.rect(self.screen, BG_DARK, (0, y, SCREEN_W, STATUS_BAR_HEIGHT))
         self.renderer.hline(0, y, SCREEN_W, BORDER)
 
-        font = get_font(FONT_SIZE_TINY)
         auto_label = "F1: Auto-click[ON]" if self._auto_click else "F1: Auto-click"
         help_text = f"TAB/1-3: Switch  |  CLICK: Insight/Buy  |  SCROLL: Navigate  |  {auto_label}  |  CTRL+S: Save  |  ESC: Quit"
-        rendered = font.render(help_text, True, TEXT_DIM)
+        rendered = render_text(help_text, TEXT_DIM, FONT_SIZE_TINY)
         self.screen.blit(rendered, (PADDING, y + 8))
 
         # Words progress on right
         total = len(self.presenter.language.word_list)
         translated = self.presenter.total_words_translated()
-        progress = font.render(f"Words: {translated}/{total}", True, GRAY)
+        progress = render_text(f"Words: {translated}/{total}", GRAY, FONT_SIZE_TINY)
         self.screen.blit(progress, (SCREEN_W - progress.get_width() - PADDING, y + 8))
 
     def _draw_notifications(self) -> None:
-        y = HEADER_HEIGHT + TAB_HEIGHT + PADDING
-        font = get_font(FONT_SIZE_SMALL)
-
-        for msg, remaining, ntype in self._notifications[:3]:
-            alpha = min(1.0, remaining / 1.0)  # Fade in last second
-            color = NOTIF_COLORS.get(ntype, GOLD)
-            bg = NOTIF_BG.get(ntype, (25, 20, 10))
+        for notif, rect in zip(self._notifications, self._notif_rects):
+            # Fade in last second, quantized so faded colors are reused
+            step = max(1, int(min(1.0, notif.remaining) * NOTIF_FADE_STEPS))
+            color = NOTIF_COLORS[notif.ntype]
+            bg = NOTIF_BG[notif.ntype]
 
-            # Fade color
-            faded = tuple(int(c * alpha) for c in color)
-            faded_bg = tuple(int(c * alpha) for c in bg)
-
-            rect_w = min(350, SCREEN_W // 3)
-            rect = pygame.Rect(SCREEN_W - rect_w - PADDING, y, rect_w, 28)
+            faded = _fade(color, step)
+            faded_bg = _fade(bg, step)
 
             pygame.draw.rect(self.screen, faded_bg, rect)
             pygame.draw.rect(self.screen, faded, rect, 1)
 
-            rendered = font.render(msg[:40], True, faded)
+            rendered = render_text(notif.msg[:40], faded, FONT_SIZE_SMALL)
             self.screen.blit(rendered, (rect.x + 6, rect.y + 5))
 
-            y += 34
-
-    def _update_cursor(self) -> None:
-        mouse_pos = pygame.mouse.get_pos()
-        is_interactive = False
-
-        # Tab bar
-        for rect, _ in self._tab_rects:
-            if rect.collidepoint(mouse_pos):
-                is_interactive = True
-                break
-
-        # Active screen interactive rects
-        if not is_interactive:
-            for rect in self._screens[self.active_screen].get_interactive_rects():
-                if rect.collidepoint(mouse_pos):
-                    is_interactive = True
-                    break
+    def _update_cursor(self, mouse_pos: tuple[int, int]) -> None:
+        # Tab bar, then the active screen's interactive rects
+        probe = pygame.Rect(mouse_pos, (1, 1))
+        is_interactive = (
+            probe.collidelist(self._tab_hit_rects) != -1
+            or probe.collidelist(self._screens[self.active_screen].get_interactive_rects()) != -1
+        )
 
+        if is_interactive == self._cursor_is_hand:
+            return
+        self._cursor_is_hand = is_interactive
         try:
             pygame.mouse.set_cursor(
                 pygame.SYSTEM_CURSOR_HAND if is_interactive else pygame.SYSTEM_CURSOR_ARROW
@@ -343,6 +390,24 @@ class App:
         except pygame.error:
             pass  # Headless/dummy video driver
 
+    def _save(self, announce: bool = False) -> Future:
+        """Snapshot state on this thread and write it on the save worker.
+
+        Failures are always reported; announce also reports success.
+        """
+        data = snapshot_game(self.presenter.runtime, self.presenter.language.seed)
+        future = self._save_executor.submit(write_save, data)
+        future.add_done_callback(functools.partial(self._on_save_done, announce=announce))
+        return future
+
+    def _on_save_done(self, future: Future, announce: bool) -> None:
+        """Queue a notification for a finished save (runs on the save worker)."""
+        exc = future.exception()
+        if exc is not None:
+            self._save_results.append(Notification(f"Save failed: {exc}", NOTIF_DURATION, NOTIF_ERROR))
+        elif announce:
+            self._save_results.append(Notification("Game saved!", NOTIF_DURATION, NOTIF_INFO))
+
     def _switch_to_screen(self, name: str) -> None:
         for i, screen in enumerate(self._screens):
             if screen.name == name:
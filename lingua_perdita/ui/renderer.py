@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import functools
+
 import pygame
 
 from lingua_perdita.ui.theme import (
@@ -13,10 +15,49 @@ from lingua_perdita.ui.theme import (
     SCREEN_H,
     SCREEN_W,
     WHITE,
+    display_format,
     get_font,
+    render_text,
 )
 
 
+@functools.lru_cache(maxsize=1024)
+def _wrap_lines(text: str, size: int, max_width: int) -> tuple[str, ...]:
+    """Greedy word wrap of text to max_width pixels at the given font size."""
+    font = get_font(size)
+    lines: list[str] = []
+    current_line = ""
+
+    for word in text.split(" "):
+        test = f"{current_line} {word}".strip()
+        if font.size(test)[0] <= max_width:
+            current_line = test
+        else:
+            if current_line:
+                lines.append(current_line)
+            current_line = word
+    if current_line:
+        lines.append(current_line)
+
+    return tuple(lines)
+
+
+@functools.lru_cache(maxsize=512)
+def _progress_bar_surface(
+    width: int, height: int, fill_w: int, color: tuple, bg_color: tuple,
+) -> pygame.Surface:
+    """Bar background, fill_w pixels of fill, and border, drawn once per state."""
+    surface = pygame.Surface((width, height))
+    if fill_w >= width:
+        surface.fill(color)  # full bar hides the background entirely
+    else:
+        surface.fill(bg_color)
+        if fill_w > 0:
+            surface.fill(color, (0, 0, fill_w, height))
+    pygame.draw.rect(surface, BORDER, surface.get_rect(), 1)
+    return display_format(surface, alpha=False)
+
+
 class Renderer:
     """Drawing utilities operating on a pygame surface."""
 
@@ -37,33 +78,18 @@ class Renderer:
         max_width: int = 0,
     ) -> int:
         """Render text with optional word wrap. Returns y after text."""
-        font = get_font(size)
-
         if not max_width:
-            rendered = font.render(text, True, color)
+            rendered = render_text(text, color, size)
             self.surface.blit(rendered, (x, y))
             return y + rendered.get_height()
 
-        # Word wrap
-        words = text.split(" ")
-        lines: list[str] = []
-        current_line = ""
-
-        for word in words:
-            test = f"{current_line} {word}".strip()
-            if font.size(test)[0] <= max_width:
-                current_line = test
-            else:
-                if current_line:
-                    lines.append(current_line)
-                current_line = word
-        if current_line:
-            lines.append(current_line)
-
-        for line in lines:
-            rendered = font.render(line, True, color)
-            self.surface.blit(rendered, (x, y))
+        # Word wrap (layout cached per text/size/width)
+        blit_seq: list[tuple[pygame.Surface, tuple[int, int]]] = []
+        for line in _wrap_lines(text, size, max_width):
+            rendered = render_text(line, color, size)
+            blit_seq.append((rendered, (x, y)))
             y += rendered.get_height() + 2
+        self.surface.blits(blit_seq, doreturn=False)
 
         return y
 
@@ -84,8 +110,7 @@ class Renderer:
         pygame.draw.rect(self.surface, color, rect, 1)
 
         if title:
-            font = get_font(FONT_SIZE_SMALL)
-            rendered = font.render(title, True, color)
+            rendered = render_text(title, color, FONT_SIZE_SMALL)
             self.surface.blit(rendered, (x + 6, y + 2))
 
     def hline(self, x: int, y: int, width: int, color: tuple = BORDER) -> None:
@@ -104,32 +129,32 @@ class Renderer:
     ) -> None:
         """Draw a progress bar (0.0 to 1.0)."""
         progress = max(0.0, min(1.0, progress))
-        rect = pygame.Rect(x, y, width, height)
-        pygame.draw.rect(self.surface, bg_color, rect)
-
-        if progress > 0:
-            fill_rect = pygame.Rect(x, y, int(width * progress), height)
-            pygame.draw.rect(self.surface, color, fill_rect)
-
-        pygame.draw.rect(self.surface, BORDER, rect, 1)
+        # Keyed on whole fill pixels, so each bar has at most width + 1 states
+        bar = _progress_bar_surface(
+            width, height, int(width * progress), tuple(color), tuple(bg_color),
+        )
+        self.surface.blit(bar, (x, y))
 
         if label:
-            font = get_font(FONT_SIZE_SMALL)
-            rendered = font.render(label, True, WHITE)
+            rendered = render_text(label, WHITE, FONT_SIZE_SMALL)
             lx = x + (width - rendered.get_width()) // 2
             ly = y + (height - rendered.get_height()) // 2
             self.surface.blit(rendered, (lx, ly))
 
     def apply_scanlines(self) -> None:
-        """CRT scanline overlay (cached)."""
+        """CRT scanline overlay (cached).
+
+        Covers the whole screen, so frames are presented with a full
+        display.flip() rather than dirty-rect updates.
+        """
         if self._scanline_surface is None:
-            self._scanline_surface = pygame.Surface(
-                (SCREEN_W, SCREEN_H), pygame.SRCALPHA
+            # One 3px strip (dark top row), tiled down the screen
+            strip = pygame.Surface((SCREEN_W, 3), pygame.SRCALPHA)
+            strip.fill((0, 0, 0, 20), (0, 0, SCREEN_W, 1))
+            overlay = pygame.Surface((SCREEN_W, SCREEN_H), pygame.SRCALPHA)
+            overlay.blits(
+                [(strip, (0, sy)) for sy in range(0, SCREEN_H, 3)],
+                doreturn=False,
             )
-            for sy in range(0, SCREEN_H, 3):
-                pygame.draw.line(
-                    self._scanline_surface,
-                    (0, 0, 0, 20),
-                    (0, sy), (SCREEN_W, sy),
-                )
+            self._scanline_surface = display_format(overlay)
         self.surface.blit(self._scanline_surface, (0, 0))
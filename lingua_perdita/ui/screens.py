@@ -23,6 +23,13 @@ from lingua_perdita.ui.theme import (
     FONT_SIZE_LARGE,
     FONT_SIZE_SMALL,
     FONT_SIZE_TINY,
+    GLYPH_LEXICON_KNOWN,
+    GLYPH_LEXICON_LIST,
+    GLYPH_LEXICON_UNKNOWN,
+    GLYPH_SHOP,
+    GLYPH_SHOP_DIM,
+    GLYPH_TABLET,
+    GLYPH_TABLET_HOVER,
     GOLD,
     GOLD_BRIGHT,
     GOLD_DIM,
@@ -34,13 +41,11 @@ from lingua_perdita.ui.theme import (
     LINE_HEIGHT_SMALL,
     PADDING,
     RED,
-    STONE,
-    STONE_DIM,
     TEXT_DIM,
     WHITE,
-    format_number,
     format_rate,
-    get_font,
+    render_cost,
+    render_text,
 )
 
 if TYPE_CHECKING:
@@ -75,11 +80,19 @@ class TabletScreen(Screen):
 
     name = "TABLET"
 
+    # Word grid cell geometry
+    CELL_W = 120
+    CELL_H = 60
+    CELL_PAD = 8
+
     def __init__(self) -> None:
         self.selected_text_idx: int = 0
         self._word_rects: list[tuple[pygame.Rect, str]] = []
+        # text index → cell rects of its visible slots; texts never change
+        self._grid_layouts: dict[int, list[pygame.Rect]] = {}
         self._text_tab_rects: list[tuple[pygame.Rect, int]] = []
         self._click_flash: float = 0.0
+        self._flash_surf: pygame.Surface | None = None
 
     def update(self, dt: float) -> None:
         if self._click_flash > 0:
@@ -93,6 +106,7 @@ class TabletScreen(Screen):
         # ── Text selector tabs ───────────────────────────────────────
         tab_y = CONTENT_TOP
         tab_w = CONTENT_WIDTH // max(len(presenter.language.text_list), 1)
+        labels: list[tuple[pygame.Surface, tuple[int, int]]] = []
 
         for ti, text in enumerate(presenter.language.text_list):
             is_unlocked = presenter.is_text_unlocked(text.id)
@@ -119,11 +133,11 @@ class TabletScreen(Screen):
                 bg = BG_PANEL
                 label = text.display_name[:20] if is_unlocked else "Locked"
 
-            pygame.draw.rect(r.surface, bg, tab_rect)
+            r.surface.fill(bg, tab_rect)
             pygame.draw.rect(r.surface, color, tab_rect, 1)
-            font = get_font(FONT_SIZE_TINY)
-            rendered = font.render(label, True, color)
-            r.surface.blit(rendered, (tab_rect.x + 4, tab_rect.y + 6))
+            labels.append((render_text(label, color, FONT_SIZE_TINY), (tab_rect.x + 4, tab_rect.y + 6)))
+
+        r.surface.blits(labels, doreturn=False)
 
         # ── Text content area ────────────────────────────────────────
         content_y = tab_y + 36
@@ -136,11 +150,10 @@ class TabletScreen(Screen):
 
         if not presenter.is_text_unlocked(text.id):
             # Show unlock requirement
-            font = get_font(FONT_SIZE)
             threshold = text.unlock_threshold
             current = presenter.total_words_translated()
             msg = f"Translate {threshold} words to unlock ({current}/{threshold})"
-            rendered = font.render(msg, True, TEXT_DIM)
+            rendered = render_text(msg, TEXT_DIM, FONT_SIZE)
             cx = CONTENT_LEFT + (CONTENT_WIDTH - rendered.get_width()) // 2
             r.surface.blit(rendered, (cx, content_y + 50))
             return
@@ -148,33 +161,26 @@ class TabletScreen(Screen):
         # Show text info bar
         translated = presenter.text_translated_count(text.id)
         total = presenter.text_total_unique_words(text.id)
-        font_sm = get_font(FONT_SIZE_SMALL)
         info = f"{text.display_name}  —  {translated}/{total} words translated"
-        rendered = font_sm.render(info, True, GRAY)
+        rendered = render_text(info, GRAY, FONT_SIZE_SMALL)
         r.surface.blit(rendered, (CONTENT_LEFT, content_y))
         content_y += LINE_HEIGHT_SMALL + 4
 
         # ── Word grid ────────────────────────────────────────────────
-        grid_x = CONTENT_LEFT + PADDING
-        grid_y = content_y + 4
-        cell_w = 120
-        cell_h = 60
-        cell_pad = 8
-        cols = max(1, (CONTENT_WIDTH - 2 * PADDING) // (cell_w + cell_pad))
-
-        for slot_idx, word_id in enumerate(text.word_ids):
+        cell_rects = self._grid_layouts.get(self.selected_text_idx)
+        if cell_rects is None:
+            cell_rects = self._layout_grid(len(text.word_ids), content_y + 4)
+            self._grid_layouts[self.selected_text_idx] = cell_rects
+        cell_w, cell_h = self.CELL_W, self.CELL_H
+        # One hit test over all cells (-1 when the mouse is outside the grid)
+        hovered_slot = pygame.Rect(mouse_pos, (1, 1)).collidelist(cell_rects)
+        # Cell contents are blitted in one batch after the backgrounds
+        blit_seq: list[tuple[pygame.Surface, tuple[int, int]]] = []
+
+        for slot_idx, (cell_rect, word_id) in enumerate(zip(cell_rects, text.word_ids)):
             word = presenter.language.words[word_id]
-            col = slot_idx % cols
-            row = slot_idx // cols
-
-            x = grid_x + col * (cell_w + cell_pad)
-            y = grid_y + row * (cell_h + cell_pad)
-
-            if y + cell_h > CONTENT_BOTTOM:
-                break
-
-            cell_rect = pygame.Rect(x, y, cell_w, cell_h)
-            is_hovered = cell_rect.collidepoint(mouse_pos)
+            x, y = cell_rect.topleft
+            is_hovered = slot_idx == hovered_slot
             is_translated = presenter.is_word_translated(word_id)
 
             # Background
@@ -190,27 +196,47 @@ class TabletScreen(Screen):
 
             if is_translated:
                 # Show English meaning
-                font = get_font(FONT_SIZE_SMALL)
-                rendered = font.render(word.meaning, True, GREEN)
+                rendered = render_text(word.meaning, GREEN, FONT_SIZE_SMALL)
                 tx = x + (cell_w - rendered.get_width()) // 2
                 ty = y + (cell_h - rendered.get_height()) // 2
-                r.surface.blit(rendered, (tx, ty))
+                blit_seq.append((rendered, (tx, ty)))
             else:
                 # Show glyph(s)
-                glyph_color = STONE if not is_hovered else WHITE
-                glyph_surface = glyph_renderer.render_word(word, 32, glyph_color)
+                glyph_style = GLYPH_TABLET_HOVER if is_hovered else GLYPH_TABLET
+                glyph_surface = glyph_renderer.render_word(word, *glyph_style)
                 gx = x + (cell_w - glyph_surface.get_width()) // 2
                 gy = y + (cell_h - glyph_surface.get_height()) // 2
-                r.surface.blit(glyph_surface, (gx, gy))
+                blit_seq.append((glyph_surface, (gx, gy)))
 
                 self._word_rects.append((cell_rect, word_id))
 
+        r.surface.blits(blit_seq, doreturn=False)
+
         # ── Click flash effect ───────────────────────────────────────
         if self._click_flash > 0:
             alpha = int(self._click_flash / 0.15 * 30)
-            flash_surf = pygame.Surface((CONTENT_WIDTH, CONTENT_HEIGHT), pygame.SRCALPHA)
-            flash_surf.fill((255, 220, 80, alpha))
-            r.surface.blit(flash_surf, (CONTENT_LEFT, CONTENT_TOP))
+            if self._flash_surf is None:
+                # Filled once; the fade only changes its surface alpha
+                self._flash_surf = pygame.Surface((CONTENT_WIDTH, CONTENT_HEIGHT))
+                self._flash_surf.fill((255, 220, 80))
+            self._flash_surf.set_alpha(alpha)
+            r.surface.blit(self._flash_surf, (CONTENT_LEFT, CONTENT_TOP))
+
+    def _layout_grid(self, slot_count: int, grid_y: int) -> list[pygame.Rect]:
+        """Cell rects for a text's word slots, row-major, cut off at the content bottom."""
+        grid_x = CONTENT_LEFT + PADDING
+        step_x = self.CELL_W + self.CELL_PAD
+        step_y = self.CELL_H + self.CELL_PAD
+        cols = max(1, (CONTENT_WIDTH - 2 * PADDING) // step_x)
+
+        cell_rects: list[pygame.Rect] = []
+        for slot_idx in range(slot_count):
+            row, col = divmod(slot_idx, cols)
+            y = grid_y + row * step_y
+            if y + self.CELL_H > CONTENT_BOTTOM:
+                break
+            cell_rects.append(pygame.Rect(grid_x + col * step_x, y, self.CELL_W, self.CELL_H))
+        return cell_rects
 
     def handle_event(self, event: pygame.event.Event, presenter: GamePresenter) -> str | None:
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
@@ -257,6 +283,9 @@ class ShopScreen(Screen):
     def __init__(self) -> None:
         self.selected_tab: int = 0
         self._item_rects: list[tuple[pygame.Rect, str]] = []
+        # Top y and stride of _item_rects when rows are evenly spaced (0 = not)
+        self._rows_top: int = 0
+        self._row_stride: int = 0
         self._subtab_rects: list[tuple[pygame.Rect, int]] = []
         self._purchase_flash: dict[str, float] = {}
         self.scroll_offset: int = 0
@@ -270,12 +299,14 @@ class ShopScreen(Screen):
 
     def draw(self, r: Renderer, presenter: GamePresenter, glyph_renderer: GlyphRenderer) -> None:
         self._item_rects.clear()
+        self._row_stride = 0
         self._subtab_rects.clear()
         mouse_pos = pygame.mouse.get_pos()
 
         # ── Sub-tabs ─────────────────────────────────────────────────
         tab_y = CONTENT_TOP
         tab_w = CONTENT_WIDTH // len(self.TABS)
+        labels: list[tuple[pygame.Surface, tuple[int, int]]] = []
 
         for i, tab_name in enumerate(self.TABS):
             is_active = i == self.selected_tab
@@ -289,11 +320,11 @@ class ShopScreen(Screen):
             else:
                 color, bg = GOLD_DIM, BG_PANEL
 
-            pygame.draw.rect(r.surface, bg, tab_rect)
+            r.surface.fill(bg, tab_rect)
             pygame.draw.rect(r.surface, color, tab_rect, 1)
-            font = get_font(FONT_SIZE_SMALL)
-            rendered = font.render(tab_name, True, color)
-            r.surface.blit(rendered, (tab_rect.x + 8, tab_rect.y + 6))
+            labels.append((render_text(tab_name, color, FONT_SIZE_SMALL), (tab_rect.x + 8, tab_rect.y + 6)))
+
+        r.surface.blits(labels, doreturn=False)
 
         # ── Content based on tab ─────────────────────────────────────
         list_y = tab_y + 36 - self.scroll_offset
@@ -316,18 +347,18 @@ class ShopScreen(Screen):
         words = presenter.get_purchasable_words()
 
         if not words:
-            font = get_font(FONT_SIZE)
-            rendered = font.render("All words translated!", True, GREEN)
+            rendered = render_text("All words translated!", GREEN, FONT_SIZE)
             r.surface.blit(rendered, (CONTENT_LEFT + PADDING, y))
             return y + LINE_HEIGHT
 
-        for word, status in words:
-            if y > CONTENT_BOTTOM:
-                break
-            if y + 56 < CONTENT_TOP + 36:
-                y += 60
-                continue
+        # Fixed 60px rows: only visit the ones inside the list viewport
+        row_h = 60
+        first = max(0, -((y + 56 - (CONTENT_TOP + 36)) // row_h))
+        last = max(first, min(len(words), (CONTENT_BOTTOM - y) // row_h + 1))
+        y += first * row_h
+        self._rows_top, self._row_stride = y, row_h
 
+        for word, status in words[first:last]:
             row_rect = pygame.Rect(CONTENT_LEFT + 4, y, CONTENT_WIDTH - 8, 54)
             is_hovered = row_rect.collidepoint(mouse_pos)
             is_affordable = status is not None and status.affordable
@@ -346,28 +377,26 @@ class ShopScreen(Screen):
             pygame.draw.rect(r.surface, GREEN_DIM if is_affordable else BORDER, row_rect, 1)
 
             # Glyph
-            glyph_color = STONE if is_affordable else STONE_DIM
-            glyph_surf = glyph_renderer.render_word(word, 28, glyph_color)
+            glyph_style = GLYPH_SHOP if is_affordable else GLYPH_SHOP_DIM
+            glyph_surf = glyph_renderer.render_word(word, *glyph_style)
             r.surface.blit(glyph_surf, (row_rect.x + 8, row_rect.y + (54 - glyph_surf.get_height()) // 2))
 
             # Cost
             cost = presenter.get_word_cost(word.id)
             cost_color = GOLD if is_affordable else TEXT_DIM
-            font = get_font(FONT_SIZE_SMALL)
-            cost_text = font.render(f"{format_number(cost)} Insight", True, cost_color)
+            cost_text = render_cost(cost, cost_color, FONT_SIZE_SMALL)
             r.surface.blit(cost_text, (row_rect.right - cost_text.get_width() - 8,
                                        row_rect.y + 8))
 
             # Category and root
             root = presenter.language.roots[word.root_id]
             root_discovered = presenter.is_root_discovered(word.root_id)
-            info_font = get_font(FONT_SIZE_TINY)
 
-            cat_text = info_font.render(word.category, True, GRAY)
+            cat_text = render_text(word.category, GRAY, FONT_SIZE_TINY)
             r.surface.blit(cat_text, (row_rect.x + 60, row_rect.y + 8))
 
             if root_discovered:
-                root_text = info_font.render(f"Root: {root.display_name} (30% off)", True, CYAN_DIM)
+                root_text = render_text(f"Root: {root.display_name} (30% off)", CYAN_DIM, FONT_SIZE_TINY)
                 r.surface.blit(root_text, (row_rect.x + 60, row_rect.y + 24))
 
             # Show text membership
@@ -376,11 +405,11 @@ class ShopScreen(Screen):
                 parts = []
                 for _tid, name, unlocked in membership:
                     parts.append(name if unlocked else "???")
-                in_text = info_font.render(f"In: {', '.join(parts)}", True, TEXT_DIM)
+                in_text = render_text(f"In: {', '.join(parts)}", TEXT_DIM, FONT_SIZE_TINY)
                 r.surface.blit(in_text, (row_rect.x + 60, row_rect.y + 38))
 
             self._item_rects.append((row_rect, word.id))
-            y += 60
+            y += row_h
 
         return y
 
@@ -393,12 +422,11 @@ class ShopScreen(Screen):
                 row_rect = pygame.Rect(CONTENT_LEFT + 4, y, CONTENT_WIDTH - 8, 48)
                 pygame.draw.rect(r.surface, (20, 30, 20), row_rect)
                 pygame.draw.rect(r.surface, GREEN_DIM, row_rect, 1)
-                font = get_font(FONT_SIZE_SMALL)
-                rendered = font.render(f"{edef.display_name} — OWNED", True, GREEN_DIM)
+                rendered = render_text(f"{edef.display_name} — OWNED", GREEN_DIM, FONT_SIZE_SMALL)
                 r.surface.blit(rendered, (row_rect.x + 8, row_rect.y + 8))
                 desc = presenter.get_effect_summary(edef.id)
                 if desc:
-                    desc_text = get_font(FONT_SIZE_TINY).render(desc, True, TEXT_DIM)
+                    desc_text = render_text(desc, TEXT_DIM, FONT_SIZE_TINY)
                     r.surface.blit(desc_text, (row_rect.x + 8, row_rect.y + 28))
                 y += 54
             else:
@@ -430,13 +458,12 @@ class ShopScreen(Screen):
         pygame.draw.rect(r.surface, GOLD_DIM if is_affordable else BORDER, row_rect, 1)
 
         # Name
-        font = get_font(FONT_SIZE_SMALL)
         name = edef.display_name
         if show_count:
             count = presenter.state.element_count(edef.id)
             name = f"{name} (x{count})"
         name_color = WHITE if is_affordable else GRAY
-        rendered = font.render(name, True, name_color)
+        rendered = render_text(name, name_color, FONT_SIZE_SMALL)
         r.surface.blit(rendered, (row_rect.x + 8, row_rect.y + 6))
 
         # Description / effect
@@ -444,15 +471,14 @@ class ShopScreen(Screen):
         if not desc and isinstance(edef.description, str):
             desc = edef.description
         if desc:
-            desc_font = get_font(FONT_SIZE_TINY)
-            desc_text = desc_font.render(desc[:60], True, TEXT_DIM)
+            desc_text = render_text(desc[:60], TEXT_DIM, FONT_SIZE_TINY)
             r.surface.blit(desc_text, (row_rect.x + 8, row_rect.y + 26))
 
         # Cost
         if status:
             cost = status.current_cost.get("insight", 0)
             cost_color = GOLD if is_affordable else TEXT_DIM
-            cost_text = font.render(f"{format_number(cost)} Insight", True, cost_color)
+            cost_text = render_cost(cost, cost_color, FONT_SIZE_SMALL)
             r.surface.blit(cost_text, (row_rect.right - cost_text.get_width() - 8, row_rect.y + 6))
 
         self._item_rects.append((row_rect, edef.id))
@@ -468,11 +494,11 @@ class ShopScreen(Screen):
                     return None
 
             # Items
-            for rect, elem_id in self._item_rects:
-                if rect.collidepoint(event.pos):
-                    if presenter.try_purchase(elem_id):
-                        self._purchase_flash[elem_id] = 0.3
-                    return None
+            elem_id = self._item_at(event.pos)
+            if elem_id is not None:
+                if presenter.try_purchase(elem_id):
+                    self._purchase_flash[elem_id] = 0.3
+                return None
 
         elif event.type == pygame.MOUSEWHEEL:
             self.scroll_offset = max(0, self.scroll_offset - event.y * 30)
@@ -487,6 +513,22 @@ class ShopScreen(Screen):
 
         return None
 
+    def _item_at(self, pos: tuple[int, int]) -> str | None:
+        """Element id of the item row under pos, if any."""
+        if self._row_stride:
+            # Evenly spaced rows: index straight into the row under the mouse
+            idx = (pos[1] - self._rows_top) // self._row_stride
+            if 0 <= idx < len(self._item_rects):
+                rect, elem_id = self._item_rects[idx]
+                if rect.collidepoint(pos):
+                    return elem_id
+            return None
+
+        for rect, elem_id in self._item_rects:
+            if rect.collidepoint(pos):
+                return elem_id
+        return None
+
     def get_interactive_rects(self) -> list[pygame.Rect]:
         rects = [r for r, _ in self._subtab_rects]
         rects.extend(r for r, _ in self._item_rects)
@@ -507,21 +549,17 @@ class LexiconScreen(Screen):
 
     def draw(self, r: Renderer, presenter: GamePresenter, glyph_renderer: GlyphRenderer) -> None:
         y = CONTENT_TOP + 4 - self.scroll_offset
-        font = get_font(FONT_SIZE_SMALL)
-        font_tiny = get_font(FONT_SIZE_TINY)
-        font_large = get_font(FONT_SIZE_LARGE)
 
         # ── Overall stats ────────────────────────────────────────────
         total_words = len(presenter.language.word_list)
         translated = presenter.total_words_translated()
-        roots_discovered = sum(
-            1 for root in presenter.language.root_list
-            if presenter.is_root_discovered(root.id)
-        )
+        # Snapshot once; the word loops below test membership against it
+        translated_ids = presenter.translated_word_ids()
+        roots_discovered = presenter.roots_discovered_count()
         total_roots = len(presenter.language.root_list)
 
         stats_text = f"Words: {translated}/{total_words}    Roots: {roots_discovered}/{total_roots}"
-        rendered = font.render(stats_text, True, WHITE)
+        rendered = render_text(stats_text, WHITE, FONT_SIZE_SMALL)
         if y >= CONTENT_TOP - 20:
             r.surface.blit(rendered, (CONTENT_LEFT, y))
         y += LINE_HEIGHT + 4
@@ -530,7 +568,7 @@ class LexiconScreen(Screen):
         y += 8
 
         # ── Root families ────────────────────────────────────────────
-        section_text = font_large.render("Root Families", True, CYAN)
+        section_text = render_text("Root Families", CYAN, FONT_SIZE_LARGE)
         if CONTENT_TOP - 20 <= y <= CONTENT_BOTTOM:
             r.surface.blit(section_text, (CONTENT_LEFT, y))
         y += LINE_HEIGHT + 8
@@ -552,7 +590,7 @@ class LexiconScreen(Screen):
                 header_color = TEXT_DIM
 
             if CONTENT_TOP - 20 <= y <= CONTENT_BOTTOM:
-                rendered = font.render(header, True, header_color)
+                rendered = render_text(header, header_color, FONT_SIZE_SMALL)
                 r.surface.blit(rendered, (CONTENT_LEFT + 4, y))
 
                 # Progress bar
@@ -568,20 +606,20 @@ class LexiconScreen(Screen):
             if discovered:
                 for wid in root.word_ids:
                     word = presenter.language.words[wid]
-                    is_translated = presenter.is_word_translated(wid)
+                    is_translated = wid in translated_ids
 
                     if CONTENT_TOP - 20 <= y <= CONTENT_BOTTOM:
                         # Glyph
-                        glyph_color = GREEN if is_translated else STONE_DIM
-                        glyph_surf = glyph_renderer.render_word(word, 18, glyph_color)
+                        glyph_style = GLYPH_LEXICON_KNOWN if is_translated else GLYPH_LEXICON_UNKNOWN
+                        glyph_surf = glyph_renderer.render_word(word, *glyph_style)
                         r.surface.blit(glyph_surf, (CONTENT_LEFT + 20, y + 1))
 
                         # Meaning (if translated)
                         if is_translated:
-                            meaning = font_tiny.render(f"= {word.meaning}", True, GREEN)
+                            meaning = render_text(f"= {word.meaning}", GREEN, FONT_SIZE_TINY)
                             r.surface.blit(meaning, (CONTENT_LEFT + 80, y + 2))
                         else:
-                            unknown = font_tiny.render("= ???", True, TEXT_DIM)
+                            unknown = render_text("= ???", TEXT_DIM, FONT_SIZE_TINY)
                             r.surface.blit(unknown, (CONTENT_LEFT + 80, y + 2))
 
                     y += LINE_HEIGHT_SMALL
@@ -593,7 +631,7 @@ class LexiconScreen(Screen):
         r.hline(CONTENT_LEFT, y, CONTENT_WIDTH)
         y += 8
 
-        section_text = font_large.render("All Translated Words", True, GREEN)
+        section_text = render_text("All Translated Words", GREEN, FONT_SIZE_LARGE)
         if CONTENT_TOP - 20 <= y <= CONTENT_BOTTOM:
             r.surface.blit(section_text, (CONTENT_LEFT, y))
         y += LINE_HEIGHT + 4
@@ -604,15 +642,15 @@ class LexiconScreen(Screen):
         row_y = y
 
         for word in presenter.language.word_list:
-            if not presenter.is_word_translated(word.id):
+            if word.id not in translated_ids:
                 continue
 
             x = CONTENT_LEFT + col * col_w
             if CONTENT_TOP - 20 <= row_y <= CONTENT_BOTTOM:
-                glyph_surf = glyph_renderer.render_word(word, 16, GREEN)
+                glyph_surf = glyph_renderer.render_word(word, *GLYPH_LEXICON_LIST)
                 r.surface.blit(glyph_surf, (x + 4, row_y + 1))
 
-                meaning = font_tiny.render(word.meaning, True, GREEN)
+                meaning = render_text(word.meaning, GREEN, FONT_SIZE_TINY)
                 r.surface.blit(meaning, (x + 50, row_y + 2))
 
             col += 1
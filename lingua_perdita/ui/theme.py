@@ -1,5 +1,8 @@
 """Visual theme constants — dark stone/parchment aesthetic."""
 
+import bisect
+import functools
+
 import pygame
 
 # ── Colors ────────────────────────────────────────────────────────────
@@ -35,6 +38,25 @@ BORDER = (60, 55, 45)
 RED = (200, 60, 40)
 RED_DIM = (120, 30, 20)
 
+# ── Glyph styles ──────────────────────────────────────────────────────
+# (size, color) for each way the screens draw a word's glyphs
+
+GLYPH_TABLET = (32, STONE)
+GLYPH_TABLET_HOVER = (32, WHITE)
+GLYPH_SHOP = (28, STONE)
+GLYPH_SHOP_DIM = (28, STONE_DIM)
+GLYPH_LEXICON_KNOWN = (18, GREEN)
+GLYPH_LEXICON_UNKNOWN = (18, STONE_DIM)
+GLYPH_LEXICON_LIST = (16, GREEN)
+
+# Every style above; prewarmed at startup
+GLYPH_STYLES = (
+    GLYPH_TABLET, GLYPH_TABLET_HOVER,
+    GLYPH_SHOP, GLYPH_SHOP_DIM,
+    GLYPH_LEXICON_KNOWN, GLYPH_LEXICON_UNKNOWN,
+    GLYPH_LEXICON_LIST,
+)
+
 # ── Layout ────────────────────────────────────────────────────────────
 
 SCREEN_W = 1024
@@ -64,53 +86,92 @@ CONTENT_HEIGHT = CONTENT_BOTTOM - CONTENT_TOP
 
 # ── Notification ──────────────────────────────────────────────────────
 
-NOTIF_ROOT = "root"
-NOTIF_MILESTONE = "milestone"
-NOTIF_INFO = "info"
+# Notification types index NOTIF_COLORS / NOTIF_BG
+NOTIF_ROOT = 0
+NOTIF_MILESTONE = 1
+NOTIF_INFO = 2
+NOTIF_ERROR = 3
 
-NOTIF_COLORS = {
-    NOTIF_ROOT: CYAN,
-    NOTIF_MILESTONE: GREEN,
-    NOTIF_INFO: GOLD,
-}
+NOTIF_COLORS = (CYAN, GREEN, GOLD, RED)
 
-NOTIF_BG = {
-    NOTIF_ROOT: (10, 25, 30),
-    NOTIF_MILESTONE: (10, 30, 15),
-    NOTIF_INFO: (30, 25, 10),
-}
+NOTIF_BG = (
+    (10, 25, 30),
+    (10, 30, 15),
+    (30, 25, 10),
+    (30, 12, 10),
+)
 
 NOTIF_DURATION = 4.0  # seconds
+NOTIF_FADE_STEPS = 16  # brightness levels in the final-second fade-out
 
 # ── Font ──────────────────────────────────────────────────────────────
 
-_font_cache: dict[int, pygame.font.Font] = {}
+@functools.lru_cache(maxsize=8)
+def get_font(size: int = FONT_SIZE) -> pygame.font.Font:
+    """Get a cached font at the given size.
 
+    Call get_font.cache_clear() if pygame.font is re-initialized.
+    """
+    return pygame.font.Font(None, size)
 
-def get_font(size: int = FONT_SIZE) -> pygame.font.Font:
-    """Get a cached font at the given size."""
-    if size not in _font_cache:
-        _font_cache[size] = pygame.font.Font(None, size)
-    return _font_cache[size]
+
+def preload_fonts() -> None:
+    """Load every theme font size up front (needs pygame.font initialized)."""
+    for size in (FONT_SIZE_TINY, FONT_SIZE_SMALL, FONT_SIZE, FONT_SIZE_LARGE):
+        get_font(size)
+
+
+def display_format(surface: pygame.Surface, alpha: bool = True) -> pygame.Surface:
+    """Convert a cached surface to the display's pixel format for fast blits.
+
+    Returned unchanged while no display mode is set (e.g. headless tools).
+    """
+    if pygame.display.get_surface() is None:
+        return surface
+    return surface.convert_alpha() if alpha else surface.convert()
+
+
+@functools.lru_cache(maxsize=2048)
+def render_text(
+    text: str, color: tuple[int, int, int], size: int = FONT_SIZE,
+) -> pygame.Surface:
+    """Render anti-aliased text once per (text, color, size).
+
+    The surface is shared between callers — blit it, never draw on it.
+    """
+    return display_format(get_font(size).render(text, True, color))
+
+
+@functools.lru_cache(maxsize=4096)
+def render_cost(
+    cost: float, color: tuple[int, int, int], size: int = FONT_SIZE,
+) -> pygame.Surface:
+    """Render an "N Insight" price label once per (cost, color, size)."""
+    return render_text(f"{format_number(cost)} Insight", color, size)
 
 
 # ── Helpers ───────────────────────────────────────────────────────────
 
+# format_number buckets: a value uses the format after the last threshold it reaches
+_NUMBER_THRESHOLDS = (0.01, 1, 100, 10_000, 1_000_000)
+_NUMBER_FORMATS = (  # (divisor, format spec, suffix)
+    (1, ".3f", ""),
+    (1, ".2f", ""),
+    (1, ".1f", ""),
+    (1, ",.0f", ""),
+    (1_000, ".1f", "K"),
+    (1_000_000, ".1f", "M"),
+)
+
+
+@functools.lru_cache(maxsize=4096)
 def format_number(value: float) -> str:
-    """Format a number for display."""
-    if value >= 1_000_000:
-        return f"{value / 1_000_000:.1f}M"
-    if value >= 10_000:
-        return f"{value / 1_000:.1f}K"
-    if value >= 100:
-        return f"{value:,.0f}"
-    if value >= 1:
-        return f"{value:.1f}"
-    if value >= 0.01:
-        return f"{value:.2f}"
-    return f"{value:.3f}"
+    """Format a number for display (cached; HUD values repeat across frames)."""
+    divisor, spec, suffix = _NUMBER_FORMATS[bisect.bisect_right(_NUMBER_THRESHOLDS, value)]
+    return f"{value / divisor:{spec}}{suffix}"
 
 
+@functools.lru_cache(maxsize=1024)
 def format_rate(rate: float) -> str:
     """Format a rate for display with +/- sign."""
     sign = "+" if rate >= 0 else ""